@@ -2,5 +2,8 @@ import os
 from typing_extensions import Final
 
 CONFIG_PATH: Final[str] = os.path.join("config", "config.json")
+HOST_LIMITS_PATH: Final[str] = os.path.join("config", "host_limits.yaml")
 DEFAULT_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
 DEFAULT_CRAWLING_FOLDER = os.path.join(os.getcwd(), "crawled")
+DEFAULT_PAGE_CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "data-scraping")
+DEFAULT_BROWSER_PROFILES_FOLDER = os.path.join(DEFAULT_PAGE_CACHE_FOLDER, "browser-profiles")
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Tuple
+
+from helper.constants import DEFAULT_PAGE_CACHE_FOLDER
+
+
+class PageCache:
+    """
+    File-based cache of the pages fetched by plain HTTP requests, so that the re-runs of a scraper do not fetch the same
+    pages again. Each page is stored in a file named after the SHA-256 of its URL and its status code, and expires after
+    a given time. The "not found" responses are cached too, for longer, to avoid probing missing pages over and over.
+    The cache is disabled by setting `SCRAPER_CACHE_DISABLE` to "1" or "true".
+
+    Variables:
+        folder (str): The folder storing the cached pages
+        ttl (int): The number of seconds a page is cached for
+        not_found_ttl (int): The number of seconds a "not found" response is cached for
+    """
+    def __init__(
+        self, folder: str = DEFAULT_PAGE_CACHE_FOLDER, ttl: int = 24 * 3600, not_found_ttl: int = 7 * 24 * 3600
+    ) -> None:
+        self.__folder = folder
+        self.__ttls = {200: ttl, 404: not_found_ttl}
+        self.__enabled = os.getenv("SCRAPER_CACHE_DISABLE", "false").lower() not in ("1", "true")
+
+    def get(self, url: str) -> Tuple[int, bytes] | None:
+        """
+        Get the cached response of the URL, if any and not expired.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            Tuple[int, bytes] | None: The status code and the content of the response, or None if not cached.
+        """
+        if not self.__enabled:
+            return None
+
+        for status_code, ttl in self.__ttls.items():
+            path = self.__get_path(url, status_code)
+            try:
+                if time.time() - os.path.getmtime(path) > ttl:
+                    continue
+                with open(path, "rb") as f:
+                    return status_code, f.read()
+            except OSError:
+                continue
+
+        return None
+
+    def set(self, url: str, status_code: int, content: bytes):
+        """
+        Cache the response of the URL. Only successful and "not found" responses are cached.
+
+        Args:
+            url (str): The URL of the page.
+            status_code (int): The status code of the response.
+            content (bytes): The content of the response.
+        """
+        if not self.__enabled or status_code not in self.__ttls:
+            return
+
+        path = self.__get_path(url, status_code)
+        try:
+            os.makedirs(self.__folder, exist_ok=True)
+            # write to a temporary file first, so that a concurrent reader never gets a partial page
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def delete(self, url: str, status_code: int):
+        """
+        Remove the cached response of the URL with the given status code, if any.
+
+        Args:
+            url (str): The URL of the page.
+            status_code (int): The status code of the response.
+        """
+        try:
+            os.remove(self.__get_path(url, status_code))
+        except OSError:
+            pass
+
+    def __get_path(self, url: str, status_code: int) -> str:
+        return os.path.join(self.__folder, f"{hashlib.sha256(url.encode()).hexdigest()}.{status_code}")
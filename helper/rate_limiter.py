@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter for the requests of a scraper. Tokens are refilled at the current rate up to
+    the capacity of the bucket, hence a burst of up to `capacity` requests is sent at once, and the next ones are spaced
+    evenly according to the rate. The rate adapts to the server with an AIMD policy: it is halved each time the server
+    throttles (HTTP 429) and increased by one request per second after a given number of consecutive successful
+    responses.
+
+    Variables:
+        rate (float): The initial number of requests per second
+        min_rate (float): The lowest number of requests per second the rate can be decreased to
+        max_rate (float): The highest number of requests per second the rate can be increased to
+        increase_after (int): The number of consecutive successful responses after which the rate is increased
+        capacity (int): The number of requests that can be sent at once, without waiting. Default is 1, i.e., the
+            requests are always spaced evenly
+    """
+    def __init__(
+        self,
+        rate: float = 4.0,
+        min_rate: float = 0.2,
+        max_rate: float = 16.0,
+        increase_after: int = 20,
+        capacity: int = 1,
+    ) -> None:
+        self.__rate = rate
+        self.__min_rate = min_rate
+        self.__max_rate = max_rate
+        self.__increase_after = increase_after
+        self.__capacity = capacity
+
+        self.__successes = 0
+        # the tokens go below zero when the bucket is exhausted, so that the waiting requests are queued in order
+        self.__tokens = float(capacity)
+        self.__last_refill = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    def acquire(self):
+        """
+        Block until the next request can be sent, i.e., until a token is available.
+        """
+        with self.__lock:
+            self.__refill()
+            self.__tokens -= 1
+            wait = -self.__tokens / self.__rate if self.__tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        """
+        Record a successful response, increasing the rate after enough consecutive ones.
+        """
+        with self.__lock:
+            self.__successes += 1
+            if self.__successes >= self.__increase_after:
+                self.__refill()
+                self.__rate = min(self.__max_rate, self.__rate + 1)
+                self.__successes = 0
+
+    def on_throttle(self, retry_after: float):
+        """
+        Record a throttled response, halving the rate, emptying the bucket and holding back all the requests for the
+        given delay.
+
+        Args:
+            retry_after (float): The delay requested by the server, in seconds.
+        """
+        with self.__lock:
+            self.__refill()
+            self.__rate = max(self.__min_rate, self.__rate / 2)
+            self.__successes = 0
+            self.__tokens = min(self.__tokens, 0) - retry_after * self.__rate
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.__capacity, self.__tokens + (now - self.__last_refill) * self.__rate)
+        self.__last_refill = now
+
+
+class Pacer:
+    """
+    Deadline-based pacing of consecutive actions (e.g., the page navigations of the browser): after each action, the
+    next one is allowed only after a random pause, but the time already spent in between (e.g., parsing the page) counts
+    towards the pause, hence only the remaining part is waited.
+
+    Variables:
+        min_pause (float): The minimum pause between two actions, in seconds
+        max_pause (float): The maximum pause between two actions, in seconds
+    """
+    def __init__(self, min_pause: float, max_pause: float) -> None:
+        self.__min_pause = min_pause
+        self.__max_pause = max_pause
+        self.__next_action = time.monotonic()
+
+    def wait(self):
+        """
+        Block until the next action is allowed.
+        """
+        if (delay := self.__next_action - time.monotonic()) > 0:
+            time.sleep(delay)
+
+    def done(self):
+        """
+        Record the end of an action, scheduling the next one after a random pause.
+        """
+        self.__next_action = time.monotonic() + random.uniform(self.__min_pause, self.__max_pause)
+
+
+def parse_retry_after(value: str | None, default: float = 5.0) -> float:
+    """
+    Parse the value of a `Retry-After` header, which is either a number of seconds or an HTTP date.
+
+    Args:
+        value (str | None): The value of the header.
+        default (float): The delay to use when the header is missing or invalid, in seconds.
+
+    Returns:
+        float: The delay, in seconds.
+    """
+    if not value:
+        return default
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
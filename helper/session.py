@@ -0,0 +1,104 @@
+import atexit
+import os
+import threading
+from typing import Dict
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from helper.constants import HOST_LIMITS_PATH
+
+# the (connect, read) timeout of the requests sent without their own, in seconds, so that a stalled response never holds
+# its pooled connection forever
+DEFAULT_TIMEOUT = (10, 60)
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session shared by the whole process, creating it on first use (i.e., within each worker process,
+    never before forking). Its connection pool keeps the connections alive, so that consecutive requests to the same
+    host skip the TCP and TLS handshakes, and caps the concurrent requests to each host (see `HOST_LIMITS_PATH` for the
+    hosts with a specific limit). The transient failures (connection errors, bad gateways and unavailable services)
+    are retried with an exponential backoff. The throttled requests (HTTP 429) are not retried here, but by the
+    scrapers, which adapt their rate accordingly. The requests without a timeout get `DEFAULT_TIMEOUT`, and the wait for
+    a free connection is bounded by `HTTP_POOL_TIMEOUT` seconds.
+
+    Returns:
+        requests.Session: The shared HTTP session.
+    """
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers["Connection"] = "keep-alive"
+
+            adapter = _build_adapter(int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "8")))
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+
+            # the hosts with a specific limit get their own adapter, matched before the default one as more specific
+            for host, max_connections in _read_host_limits().items():
+                host_adapter = _build_adapter(int(max_connections))
+                _session.mount(f"http://{host}/", host_adapter)
+                _session.mount(f"https://{host}/", host_adapter)
+
+            atexit.register(_session.close)
+
+    return _session
+
+
+class _BoundedHTTPConnectionPool(HTTPConnectionPool):
+    def urlopen(self, *args, **kwargs):
+        # requests never passes a pool timeout, hence a blocking pool would wait forever for a free connection
+        kwargs["pool_timeout"] = kwargs.get("pool_timeout") or float(os.getenv("HTTP_POOL_TIMEOUT", "120"))
+        return super().urlopen(*args, **kwargs)
+
+
+class _BoundedHTTPSConnectionPool(_BoundedHTTPConnectionPool, HTTPSConnectionPool):
+    pass
+
+
+class _BoundedHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter whose pools bound the wait for a free connection, and whose requests time out by default.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _BoundedHTTPConnectionPool, "https": _BoundedHTTPSConnectionPool
+        }
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super().proxy_manager_for(*args, **kwargs)
+        manager.pool_classes_by_scheme = {"http": _BoundedHTTPConnectionPool, "https": _BoundedHTTPSConnectionPool}
+        return manager
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout or DEFAULT_TIMEOUT, **kwargs)
+
+
+def _build_adapter(max_connections: int) -> HTTPAdapter:
+    # block when all the connections to a host are busy, so that the concurrent requests (e.g., the pages of a
+    # pagination) wait for a keep-alive connection instead of opening throwaway ones: the size of the pool caps the
+    # requests in flight to each host, streamed responses included, since they hold their connection
+    return _BoundedHTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max_connections,
+        pool_block=True,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False),
+    )
+
+
+def _read_host_limits() -> Dict[str, int]:
+    # the maximum number of concurrent requests of the hosts which need a specific limit, if any
+    try:
+        with open(HOST_LIMITS_PATH, "r") as file:
+            return yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        return {}
@@ -1,36 +1,44 @@
+import hashlib
 import importlib
 import inspect
 import json
 import os
 import pkgutil
 import random
+import threading
 import time
+from contextlib import ExitStack, contextmanager
 from multiprocessing import Queue
 import zipfile
-from typing import Dict, List, Type, Tuple
-import requests
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Generator, List, Type, Tuple
 import yaml
 from bs4 import Tag
 from urllib.parse import urlparse, parse_qs
 from fake_useragent import UserAgent, FakeUserAgentError
-from selenium.webdriver.remote.webelement import WebElement
-from seleniumbase import SB
-from seleniumbase.undetected.cdp_driver.element import Element
 import filetype
 import magic
 import mimetypes
 
-from helper.constants import DEFAULT_UA
+from helper.constants import DEFAULT_BROWSER_PROFILES_FOLDER, DEFAULT_UA
 from helper.logger import setup_logger
+from helper.session import DEFAULT_TIMEOUT, get_session
 from helper.worker import setup_worker_logging, setup_workers
 from model.analytics_models import AnalyticsModelItem, AnalyticsModelItemRatio, AnalyticsModelItemTotal
-from scraper.base_scraper import BaseScraper, BaseMappedSubScraper
+if TYPE_CHECKING:
+    # selenium is imported only when a browser is started, and the scrapers import this module
+    from selenium.webdriver.remote.webelement import WebElement
+    from scraper.base_scraper import BaseScraper
 
 try:
     _ua = UserAgent()
 except FakeUserAgentError:
     _ua = None
 
+# the browser shared by the resources retrieved by scraping in the current thread, within `reuse_remote_browser`
+_remote_browser = threading.local()
+
 
 # Load the YAML file
 def read_yaml_file(file_path: str):
@@ -80,6 +88,59 @@ def get_file_extension_from_file_content(content: bytes) -> str | None:
     return kind.extension
 
 
+def get_file_fingerprint(file_path: str, sample_size: int = 64 * 1024) -> Tuple[int, int]:
+    """
+    Get a quick fingerprint of a file, i.e., its size and the CRC-32 of its first and last bytes. Files with different
+    fingerprints certainly have a different content, while files with the same fingerprint must be compared by hash.
+
+    Args:
+        file_path (str): The path of the file.
+        sample_size (int): The number of bytes to read from the beginning and from the end of the file.
+
+    Returns:
+        Tuple[int, int]: The size of the file and the CRC-32 of its sampled bytes.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        checksum = zlib.crc32(f.read(sample_size))
+        if size > sample_size:
+            f.seek(max(sample_size, size - sample_size))
+            checksum = zlib.crc32(f.read(sample_size), checksum)
+
+    return size, checksum
+
+
+def get_file_sha256(file_path: str) -> str:
+    """
+    Get the SHA-256 of a file, reading it in chunks.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the file.
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def dump_json(data) -> str:
+    """
+    Serialize an object to compact JSON, i.e., without the whitespaces after the separators, for the outputs stored in
+    the database, which can hold tens of thousands of links
+
+    Args:
+        data: The object to serialize
+
+    Returns:
+        str: The JSON of the object
+    """
+    return json.dumps(data, separators=(",", ":"))
+
+
 def is_json_serializable(data) -> bool:
     """
     Check if an object can be serialized to JSON
@@ -91,7 +152,7 @@ def is_json_serializable(data) -> bool:
         return False
 
 
-def discover_scrapers(log_file: str = "logs/scraping.log") -> Dict[str, Type[BaseScraper]]:
+def discover_scrapers(log_file: str = "logs/scraping.log") -> Dict[str, Type["BaseScraper"]]:
     """
     Find all scraper classes in the specified package and run them in separate threads.
 
@@ -101,6 +162,8 @@ def discover_scrapers(log_file: str = "logs/scraping.log") -> Dict[str, Type[Bas
     Returns:
         Dict[str, BaseScraper]: A dictionary of scraper names and their classes (i.e., the type).
     """
+    from scraper.base_scraper import BaseScraper, BaseMappedSubScraper
+
     logger = setup_logger(__name__, log_file)
     base_package = "scraper"
 
@@ -126,7 +189,7 @@ def discover_scrapers(log_file: str = "logs/scraping.log") -> Dict[str, Type[Bas
 
 
 def run_scrapers(
-    discovered_scrapers: Dict[str, Type[BaseScraper]],
+    discovered_scrapers: Dict[str, Type["BaseScraper"]],
     config: Dict[str, Dict],
     log_file: str = "logs/scraping.log",
     force: bool = False,
@@ -140,7 +203,7 @@ def run_scrapers(
         log_file (str): Path to the log file.
         force (bool): Whether to force scraping of all resources.
     """
-    def run_scraper_process(log_queue: Queue, class_type_scraper: Type[BaseScraper], config_scraper: Dict):
+    def run_scraper_process(log_queue: Queue, class_type_scraper: Type["BaseScraper"], config_scraper: Dict):
         setup_worker_logging(log_queue, logger_name)
         scraper_obj = class_type_scraper()
         scraper_obj.set_config_model_from_dict(config_scraper)
@@ -151,7 +214,7 @@ def run_scrapers(
 
 
 def resume_scrapers(
-    discovered_scrapers: Dict[str, Type[BaseScraper]],
+    discovered_scrapers: Dict[str, Type["BaseScraper"]],
     config: Dict[str, Dict],
     log_file: str = "logs/scraping.log",
 ):
@@ -164,7 +227,7 @@ def resume_scrapers(
         config (Dict[str, Dict]): A dictionary of scraper names and their configurations.
         log_file (str): Path to the log file.
     """
-    def run_resume_process(log_queue: Queue, class_type_scraper: Type[BaseScraper], config_scraper: Dict):
+    def run_resume_process(log_queue: Queue, class_type_scraper: Type["BaseScraper"], config_scraper: Dict):
         setup_worker_logging(log_queue, logger_name)
         scraper_obj = class_type_scraper()
         scraper_obj.set_config_model_from_dict(config_scraper)
@@ -175,7 +238,7 @@ def resume_scrapers(
 
 
 def resume_upload_scrapers(
-    discovered_scrapers: Dict[str, Type[BaseScraper]],
+    discovered_scrapers: Dict[str, Type["BaseScraper"]],
     config: Dict[str, Dict],
     log_file: str = "logs/scraping.log",
 ):
@@ -188,7 +251,7 @@ def resume_upload_scrapers(
         config (Dict[str, Dict]): A dictionary of scraper names and their configurations.
         log_file (str): Path to the log file.
     """
-    def run_resume_upload_process(log_queue: Queue, class_type_scraper: Type[BaseScraper], config_scraper: Dict):
+    def run_resume_upload_process(log_queue: Queue, class_type_scraper: Type["BaseScraper"], config_scraper: Dict):
         setup_worker_logging(log_queue, logger_name)
         scraper_obj = class_type_scraper()
         scraper_obj.set_config_model_from_dict(config_scraper)
@@ -237,18 +300,24 @@ def unpack_zip_files(directory: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=2)
+def _get_user_agents(include_mobile: bool, size: int = 100) -> Tuple[str, ...]:
+    # a pool of user agents is drawn once with `UserAgent.random`, which weights them by usage, instead of drawing (and
+    # discarding the mobile ones) at each request, since each draw filters the whole dataset; the random picks from the
+    # pool keep the same weighting. Without mobile ones, the pool is drawn among the desktop user agents only
+    ua = _ua if include_mobile else UserAgent(platforms="desktop")
+    user_agents = tuple(
+        user_agent for user_agent in (ua.random for _ in range(size))
+        if include_mobile or "mobile" not in user_agent.lower()
+    )
+    return user_agents or (DEFAULT_UA,)
+
+
 def get_user_agent(include_mobile: bool = False) -> str:
     if _ua is None:
         return DEFAULT_UA
 
-    random_ua = _ua.random
-    if include_mobile:
-        return random_ua
-
-    while "mobile" in random_ua.lower():
-        random_ua = _ua.random
-
-    return random_ua
+    return random.choice(_get_user_agents(include_mobile))
 
 
 def get_interacting_proxy_config() -> str:
@@ -320,7 +389,7 @@ def extract_lists(input_data: List | Dict) -> List[str]:
             for item in value:
                 extracted_lists.extend(extract_lists(item))
 
-    return list(set(extracted_lists))
+    return list(dict.fromkeys(extracted_lists))
 
 
 def build_analytics(successes: List[str], failures: List[str]) -> AnalyticsModelItem:
@@ -357,19 +426,20 @@ def get_bool_env(key: str, default: str) -> bool:
     return v == "true" or v == "1"
 
 
-def get_scraped_url_by_bs_tag(tag: Tag, base_url: str, with_querystring: bool | None = False) -> str:
+@lru_cache(maxsize=4096)
+def get_scraped_url(href: str, base_url: str, with_querystring: bool | None = False) -> str:
     """
-    Get the URL from the Tag.
+    Get the URL from the href of a link. The results are cached, since the same links are usually listed several times
+    by the scraped pages.
 
     Args:
-        tag (Tag): The BeautifulSoup tag.
+        href (str): The href of the link.
         base_url (str): The base URL.
         with_querystring (bool): Whether to include the query string in the URL.
 
     Returns:
-        List[str]: A list of URLs of the articles in the issue.
+        str: The URL of the link.
     """
-    href = tag.get("href", getattr(tag, "href"))
     if href.startswith("http"):
         return href.strip()
 
@@ -383,7 +453,22 @@ def get_scraped_url_by_bs_tag(tag: Tag, base_url: str, with_querystring: bool |
     return result if with_querystring else remove_query_string_from_url(result)
 
 
-def get_scraped_url_by_web_element(we: WebElement, base_url: str, with_querystring: bool | None = False) -> str:
+def get_scraped_url_by_bs_tag(tag: Tag, base_url: str, with_querystring: bool | None = False) -> str:
+    """
+    Get the URL from the Tag.
+
+    Args:
+        tag (Tag): The BeautifulSoup tag.
+        base_url (str): The base URL.
+        with_querystring (bool): Whether to include the query string in the URL.
+
+    Returns:
+        List[str]: A list of URLs of the articles in the issue.
+    """
+    return get_scraped_url(tag.get("href", getattr(tag, "href")), base_url, with_querystring)
+
+
+def get_scraped_url_by_web_element(we: "WebElement", base_url: str, with_querystring: bool | None = False) -> str:
     """
     Get the URL from the Tag.
 
@@ -395,23 +480,33 @@ def get_scraped_url_by_web_element(we: WebElement, base_url: str, with_querystri
     Returns:
         List[str]: A list of URLs of the articles in the issue.
     """
-    href = we.get_attribute("href") or getattr(we, "href")
-    if href.startswith("http"):
-        return href.strip()
+    return get_scraped_url(we.get_attribute("href") or getattr(we, "href"), base_url, with_querystring)
 
-    # Remove trailing/leading slashes except in http(s)://
-    prefix = base_url.rstrip("/")
-    if prefix.endswith(":"):
-        prefix += "//"
 
-    # Join with single slash
-    result = f"{prefix}/{href.lstrip('/').strip()}"
-    return result if with_querystring else remove_query_string_from_url(result)
+def download_resource_from_remote_by_request(
+    source_url: str,
+    file_path: str,
+    request_with_proxy: bool = False,
+    max_retries: int | None = 5,
+    chunk_size: int = 1024 * 1024,
+    header_size: int = 8 * 1024,
+) -> Tuple[str | None, bytes]:
+    """
+    Download the resource into the file, streaming it in chunks instead of loading it into memory, and hashing it on the
+    fly.
 
+    Args:
+        source_url (str): The URL of the resource.
+        file_path (str): The path of the file to write the resource to.
+        request_with_proxy (bool): Whether to send the request through the proxy.
+        max_retries (int): The maximum number of retries.
+        chunk_size (int): The size of the chunks read from the response, in bytes.
+        header_size (int): The size of the leading bytes to return, in bytes.
 
-def get_resource_from_remote_by_request(
-    source_url: str, request_with_proxy: bool = False, max_retries: int | None = 5
-) -> bytes:
+    Returns:
+        Tuple[str | None, bytes]: The SHA-256 of the resource, or None if the resource is empty, and its leading bytes,
+        enough to guess its type.
+    """
     proxy = get_interacting_proxy_config()
     headers = {
         "User-Agent": get_user_agent(),
@@ -425,13 +520,22 @@ def get_resource_from_remote_by_request(
         if retry_count > 0:
             headers["Accept-Encoding"] = "identity"
         try:
-            response = requests.get(
-                source_url, headers=headers, proxies={"http": proxy, "https": proxy}, verify=False
-            ) if request_with_proxy else requests.get(source_url, headers=headers)
-
-            response.raise_for_status()  # Check for request errors
-
-            return response.content
+            kwargs = {"proxies": {"http": proxy, "https": proxy}, "verify": False} if request_with_proxy else {}
+            with get_session().get(
+                source_url, headers=headers, stream=True, timeout=DEFAULT_TIMEOUT, **kwargs
+            ) as response:
+                response.raise_for_status()  # Check for request errors
+
+                sha256 = hashlib.sha256()
+                header = b""
+                with open(file_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        sha256.update(chunk)
+                        if len(header) < header_size:
+                            header += chunk[:header_size - len(header)]
+                        f.write(chunk)
+
+            return (sha256.hexdigest() if header else None), header
         except Exception as e:
             retry_count += 1
             if retry_count <= max_retries:
@@ -442,16 +546,38 @@ def get_resource_from_remote_by_request(
     raise Exception(f"Failed to retrieve the content from {source_url}")
 
 
+@contextmanager
+def reuse_remote_browser() -> Generator[None, None, None]:
+    """
+    Within the context, the resources retrieved by scraping in the current thread share a single browser, started for
+    the first of them and closed at the end, instead of starting a new browser for each resource.
+    """
+    with ExitStack() as stack:
+        _remote_browser.stack = stack
+        try:
+            yield
+        finally:
+            _remote_browser.__dict__.clear()
+
+
 def get_resource_from_remote_by_scraping(
     source_url: str,
     loading_tag: str | None = None,
     cookie_selector: str | None = None,
     timeout: int | None = 10,
 ) -> bytes:
+    from seleniumbase import SB
+
     # return the resource from the scraping if the loading tag is provided
-    with SB(**get_sb_configuration()) as sb:
-        sb.activate_cdp_mode(source_url)
-        sb.maximize()
+    with ExitStack() as stack:
+        if (sb := getattr(_remote_browser, "sb", None)) is None:
+            sb = getattr(_remote_browser, "stack", stack).enter_context(SB(**get_sb_configuration()))
+            sb.activate_cdp_mode()
+            sb.maximize()
+            if hasattr(_remote_browser, "stack"):
+                _remote_browser.sb = sb
+
+        sb.cdp.open(source_url)
         sb.cdp.sleep(1)
         sb.uc_gui_click_captcha()
 
@@ -459,45 +585,40 @@ def get_resource_from_remote_by_scraping(
         if loading_tag:
             sb.cdp.assert_element_absent(loading_tag, timeout=timeout)
 
-        # Handle cookie popup
-        if cookie_selector:
+        # Handle cookie popup, only until dismissed in a shared browser, since it is not shown anymore afterwards
+        if cookie_selector and not getattr(_remote_browser, "cookie_handled", False):
             try:
                 sb.cdp.click(cookie_selector, timeout=timeout)
+                if hasattr(_remote_browser, "sb"):
+                    _remote_browser.cookie_handled = True
             except:
                 pass
 
-        # Sleep for some time to avoid being blocked by the server on the next request
-        sb.cdp.sleep(random.uniform(2, 5))
-
-        # Get the fully rendered HTML
+        # Get the fully rendered HTML: the pace of the requests to the server is kept by the download rate limiter of
+        # the calling scraper
         content = sb.cdp.get_page_source()
         return content.encode("utf-8")
 
 
-def get_sb_configuration() -> Dict:
-    return {
+def get_sb_configuration(profile: str | None = None) -> Dict:
+    """
+    Get the configuration of the browser.
+
+    Args:
+        profile (str | None): The name of the browser profile to persist across the runs (e.g., the name of the
+            scraper), so that the cookies (e.g., the consent to the cookies) are kept. The profile cannot be used by two
+            browsers at once. If None, or if `BROWSER_PERSIST_PROFILE` is disabled, a temporary profile is used.
+
+    Returns:
+        Dict: The keyword arguments of `SB`.
+    """
+    configuration = {
         "undetectable": True,
         "locale_code": "en",
         "headless2": get_bool_env("HEADLESS_BROWSER", "true"),
         "disable_cookies": False,
         "xvfb": get_bool_env("XVFB_MODE", "false"),
     }
-
-
-def get_ancestor(tag: Element, selector: str) -> Element | None:
-    if not tag or not selector:
-        return None
-
-    parts = selector.split(".")
-    tag_name = None if selector.startswith(".") else parts[0]
-    class_names = parts[1:] if "." in selector else []
-    class_names = [class_name for class_name in class_names if class_name]
-
-    condition = all([class_name in tag.class_ for class_name in class_names])
-    if tag_name:
-        condition = tag.tag_name == tag_name and condition
-
-    if condition:
-        return tag
-
-    return get_ancestor(tag.get_parent(), selector) if tag.get_parent() else None
+    if profile and get_bool_env("BROWSER_PERSIST_PROFILE", "true"):
+        configuration["user_data_dir"] = os.path.join(DEFAULT_BROWSER_PROFILES_FOLDER, profile)
+    return configuration
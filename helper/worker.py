@@ -1,12 +1,13 @@
 import logging
 from multiprocessing import Queue, Process
 from logging.handlers import QueueHandler, QueueListener
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Dict, Type
 import time
 from pydantic import ValidationError
 import queue
 
-from scraper.base_scraper import BaseScraper
+if TYPE_CHECKING:
+    from scraper.base_scraper import BaseScraper
 
 
 def setup_worker_logging(queue_: Queue, name: str):
@@ -31,7 +32,7 @@ def setup_worker_logging(queue_: Queue, name: str):
 
 
 def setup_workers(
-    discovered_scrapers: Dict[str, Type[BaseScraper]],
+    discovered_scrapers: Dict[str, Type["BaseScraper"]],
     config: Dict[str, Dict],
     target_function: callable,
     logger_name: str,
@@ -26,7 +26,7 @@ class BaseIterativeWithConstraintPublisherConfig(BaseConfig):
     journals: List[BaseIterativeWithConstraintPublisherJournal]
 
 
-IterativePublisherScrapeOutput: TypeAlias = Dict[str, Dict[int, Dict[int, List[str]]]]
-IterativePublisherScrapeJournalOutput: TypeAlias = Dict[int, Dict[int, List[str]]]
+IterativePublisherScrapeOutput: TypeAlias = Dict[str, Dict[str, List[str]]]
+IterativePublisherScrapeJournalOutput: TypeAlias = Dict[str, List[str]]  # keyed by "{volume}/{issue}"
 IterativePublisherScrapeVolumeOutput: TypeAlias = Dict[int, List[str]]
 IterativePublisherScrapeIssueOutput: TypeAlias = List[str]
@@ -1,4 +1,5 @@
 from abc import ABC
+from typing import Tuple
 from pydantic import BaseModel
 
 
@@ -19,3 +20,7 @@ class BaseConfig(Config, ABC):
     loading_tag: str | None = None  # The tag that indicates that the page is still loading
     waited_tag: str | None = None  # The tag that indicates that the page has loaded
     request_with_proxy: bool = False
+    inter_request_delay: Tuple[float, float] = (0.1, 0.5)  # The range of the pause between two pages, in seconds
+    block_resources: bool = True  # Whether the images, media, fonts and trackers are not loaded by the browser
+    max_scrolls: int = 200  # The maximum number of scrolls of a page, to stop the infinite feeds
+    max_height_px: int = 500_000  # The height of a page, in pixels, beyond which it is not scrolled anymore
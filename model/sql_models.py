@@ -52,6 +52,7 @@ class UploadedResource(BaseModel):
     source: str
     sha256: str | None = None
     content: bytes | None = None
+    content_path: str | None = None
     content_retrieved: bool | None = False
     success: bool | None = False
     message: str | None = None
@@ -103,6 +104,60 @@ class ScraperOutput(BaseModel):
         return "scraper_outputs"
 
 
+class ScrapedArticle(BaseModel):
+    scraper: str
+    source: str
+    pdf_link: str
+
+    @classmethod
+    def def_types(cls) -> Dict[str, DatabaseFieldDefinition]:
+        return {
+            "scraper": DatabaseFieldDefinition(type=String(length=255), nullable=False),
+            "source": DatabaseFieldDefinition(type=Text, nullable=False),
+            "pdf_link": DatabaseFieldDefinition(type=Text, nullable=False),
+            "last_access_at": DatabaseFieldDefinition(type=String(length=255), nullable=False),
+        }
+
+    @classmethod
+    def def_relations(cls) -> List[DatabaseRelationDefinition]:
+        return []
+
+    @classmethod
+    def table_name(cls) -> str:
+        return "scraped_articles"
+
+
+class ScrapedIssue(BaseModel):
+    scraper: str
+    journal: str
+    volume: int
+    issue: int
+    output: str
+
+    @property
+    def output_json(self) -> List[str]:
+        return json.loads(self.output)
+
+    @classmethod
+    def def_types(cls) -> Dict[str, DatabaseFieldDefinition]:
+        return {
+            "scraper": DatabaseFieldDefinition(type=String(length=255), nullable=False),
+            "journal": DatabaseFieldDefinition(type=String(length=255), nullable=False),
+            "volume": DatabaseFieldDefinition(type=Integer, nullable=False),
+            "issue": DatabaseFieldDefinition(type=Integer, nullable=False),
+            "output": DatabaseFieldDefinition(type=LONGTEXT, nullable=False),
+            "last_access_at": DatabaseFieldDefinition(type=String(length=255), nullable=False),
+        }
+
+    @classmethod
+    def def_relations(cls) -> List[DatabaseRelationDefinition]:
+        return []
+
+    @classmethod
+    def table_name(cls) -> str:
+        return "scraped_issues"
+
+
 class ScraperFailure(BaseModel):
     scraper: str
     source: str
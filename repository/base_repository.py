@@ -164,6 +164,19 @@ class BaseRepository(ABC):
             return None
         return self.model_type(**records[0])
 
+    def get_distinct(self, field: str, conditions: Dict[str, Any] | None = None) -> List[Any]:
+        """
+        Get the distinct values of a field of the records, without loading the records themselves
+
+        Args:
+            field (str): The field
+            conditions (Dict[str, Any]): The condition criteria of the records, if any
+
+        Returns:
+            List[Any]: The distinct values of the field
+        """
+        return self._database_manager.get_distinct_values(self.table_name, field, conditions)
+
     def delete(self, record_id: int) -> bool:
         """
         Delete a record from the database by its ID
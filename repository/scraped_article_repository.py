@@ -0,0 +1,10 @@
+from typing import Type
+
+from model.sql_models import ScrapedArticle
+from repository.base_repository import BaseRepository
+
+
+class ScrapedArticleRepository(BaseRepository):
+    @property
+    def model_type(self) -> Type[ScrapedArticle]:
+        return ScrapedArticle
@@ -0,0 +1,10 @@
+from typing import Type
+
+from model.sql_models import ScrapedIssue
+from repository.base_repository import BaseRepository
+
+
+class ScrapedIssueRepository(BaseRepository):
+    @property
+    def model_type(self) -> Type[ScrapedIssue]:
+        return ScrapedIssue
@@ -1,17 +1,27 @@
 import hashlib
 import os
+import tempfile
+from functools import lru_cache
 from typing import Type
 from uuid import uuid4
 
+from helper.utils import get_file_sha256
 from model.base_models import BaseConfig
 from model.sql_models import UploadedResource
 from repository.base_repository import BaseRepository
 
 
+@lru_cache(maxsize=None)
+def _get_root_key(bucket_key: str) -> str:
+    # the root key of the resources is the same for all the resources of a scraper, hence it is built once
+    return bucket_key.format(main_folder=os.getenv("AWS_MAIN_FOLDER", "raw_data"))
+
+
 class UploadedResourceRepository(BaseRepository):
     def get_by_url(self, scraper: str, source_url: str, config: BaseConfig) -> UploadedResource:
         """
-        Retrieve a resource from the database by its URL
+        Retrieve a resource from the database by its URL. When the resource is retrieved by request, its content is
+        downloaded into a temporary file (see `content_path`), which must be removed by the caller once uploaded.
 
         Args:
             scraper (str): The scraper of the resource
@@ -22,7 +32,7 @@ class UploadedResourceRepository(BaseRepository):
             UploadedResource | None: The resource if found, or None otherwise
         """
         from helper.utils import (
-            get_resource_from_remote_by_request,
+            download_resource_from_remote_by_request,
             get_resource_from_remote_by_scraping,
             get_file_extension_from_file_content,
         )
@@ -30,32 +40,53 @@ class UploadedResourceRepository(BaseRepository):
         self._logger.info(f"Retrieving file from {source_url}")
 
         bucket_key = os.path.join(
-            config.bucket_key.format(main_folder=os.getenv("AWS_MAIN_FOLDER", "raw_data")),
+            _get_root_key(config.bucket_key),
             f"{uuid4()}",
         )  # Construct S3 key
         result = UploadedResource(scraper=scraper, bucket_key=bucket_key, source=source_url)
+        content = None
+        content_path = None
+        sha256 = None
         try:
             files_by_request = config.files_by_request
             loading_tag = config.loading_tag
             cookie_selector = config.cookie_selector
             request_with_proxy = config.request_with_proxy
 
-            content = get_resource_from_remote_by_request(
-                source_url, request_with_proxy
-            ) if files_by_request else get_resource_from_remote_by_scraping(
-                source_url, loading_tag, cookie_selector
-            )
+            if files_by_request:
+                # stream the file to a temporary file, which is streamed to S3 on upload and removed by the caller, so
+                # that the memory footprint does not depend on the size of the file
+                fd, content_path = tempfile.mkstemp(prefix="resource-")
+                os.close(fd)
+                sha256, header = download_resource_from_remote_by_request(source_url, content_path, request_with_proxy)
+                if not sha256:
+                    os.remove(content_path)
+                    content_path = None
+            else:
+                header = content = get_resource_from_remote_by_scraping(source_url, loading_tag, cookie_selector)
 
             message = None
-            file_extension = get_file_extension_from_file_content(content)
+            file_extension = get_file_extension_from_file_content(header)
         except Exception as e:
             self._logger.error(f"Failed to retrieve the content from {source_url}. Error: {e}")
+            if content_path and os.path.exists(content_path):
+                os.remove(content_path)
 
             content = None
+            content_path = None
+            sha256 = None
             message = str(e)
             file_extension = None
 
-        return self.__update_resource(result, scraper, content=content, message=message, file_extension=file_extension)
+        return self.__update_resource(
+            result,
+            scraper,
+            content=content,
+            message=message,
+            file_extension=file_extension,
+            content_path=content_path,
+            sha256=sha256,
+        )
 
     def get_by_content(self, scraper: str, root_key: str, source_path: str) -> UploadedResource:
         """
@@ -72,21 +103,28 @@ class UploadedResourceRepository(BaseRepository):
         file_extension = os.path.basename(source_path).split(".")[-1]
 
         bucket_key = os.path.join(
-            root_key.format(main_folder=os.getenv("AWS_MAIN_FOLDER", "raw_data")),
+            _get_root_key(root_key),
             f"{uuid4()}",
         )  # Construct S3 key
 
         result = UploadedResource(bucket_key=bucket_key, source=source_path, scraper=scraper)
         message = None
         try:
-            with open(source_path, "rb") as f:
-                content = f.read()
-        except Exception as e:
+            # hash the file in chunks, without loading it into memory: it is streamed from disk on upload
+            sha256 = get_file_sha256(source_path) if os.path.getsize(source_path) else None
+        except OSError as e:
             self._logger.error(f"Failed to retrieve the content from {source_path}. Error: {e}")
-            content = None
+            sha256 = None
             message = str(e)
 
-        return self.__update_resource(result, scraper, content=content, message=message, file_extension=file_extension)
+        return self.__update_resource(
+            result,
+            scraper,
+            message=message,
+            file_extension=file_extension,
+            content_path=source_path if sha256 else None,
+            sha256=sha256,
+        )
 
     def __update_resource(
         self,
@@ -94,18 +132,20 @@ class UploadedResourceRepository(BaseRepository):
         scraper: str,
         content: bytes | None = None,
         message: str | None = None,
-        file_extension: str | None = None
+        file_extension: str | None = None,
+        content_path: str | None = None,
+        sha256: str | None = None,
     ) -> UploadedResource:
         if file_extension:
             resource.bucket_key = f"{resource.bucket_key}.{file_extension}"
 
-        if not content:
+        if not content and not content_path:
             resource.content_retrieved = False
             resource.message = message
             return resource
 
-        # calculate the sha256 of the content
-        sha256 = hashlib.sha256(content).hexdigest()
+        # calculate the sha256 of the content, unless already calculated from the file of the content
+        sha256 = sha256 or hashlib.sha256(content).hexdigest()
 
         # search for the resource in the database by using the sha256
         record = self.get_one_by({"sha256": sha256, "scraper": scraper})
@@ -113,6 +153,7 @@ class UploadedResourceRepository(BaseRepository):
             resource = record
 
         resource.content = content
+        resource.content_path = content_path
         resource.sha256 = sha256
         resource.content_retrieved = True
 
@@ -1,10 +1,19 @@
 from typing import Type, List
 from bs4 import ResultSet, Tag
+from lxml import etree
+import soupsieve
 
 from helper.utils import get_scraped_url_by_bs_tag
 from model.base_pagination_publisher_models import BasePaginationPublisherScrapeOutput, BasePaginationPublisherConfig
 from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScraper
 
+_RESULTS_COLUMN_SELECTOR = soupsieve.compile("div.results-column")
+_PDF_LINK_SELECTOR = soupsieve.compile('a[class*="pdf-download"][href*="/downloadpdf/"]')
+
+
+def _is_results_column(element: etree._Element) -> bool:
+    return "results-column" in element.get("class", "").split()
+
 
 class AMSScraper(BasePaginationPublisherScraper):
     @property
@@ -25,18 +34,12 @@ class AMSScraper(BasePaginationPublisherScraper):
 
     def _scrape_page(self, url: str) -> ResultSet | List[Tag] | None:
         try:
-            scraper = self._scrape_url(url)
-
-            results_block = scraper.find("div", class_=lambda class_: class_ and "results-column" in class_)
-            if not results_block:
-                raise Exception(f"Results not found in URL {url}")
-
-            # Find all PDF links using appropriate class or tag (if lambda returns True, it will be included in the list)
-            if not (pdf_tag_list := scraper.find_all(
-                    "a",
-                    href=lambda href: href and "/downloadpdf/" in href,
-                    class_=lambda class_: class_ and "pdf-download" in class_
-            )):
+            # the browse pages are server-rendered, hence stream them with a plain HTTP request first and fall back to
+            # the browser only when the results are missing (e.g., an anti-bot challenge was served instead)
+            if (pdf_tag_list := self.__stream_page(url)) is None:
+                pdf_tag_list = self.__render_page(url)
+
+            if not pdf_tag_list:
                 self._save_failure(url)
 
             self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
@@ -45,5 +48,52 @@ class AMSScraper(BasePaginationPublisherScraper):
             self._log_and_save_failure(url, f"Failed to process URL {url}. Error: {e}")
             return None
 
+    def __stream_page(self, url: str) -> List[Tag] | None:
+        """
+        Stream the page and collect the PDF links of the results column, stopping as soon as it is closed.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            List[Tag] | None: A list of Tag objects containing the PDF links, or None if the results were not found.
+        """
+        pdf_tag_list = []
+        try:
+            for element in self._iter_elements_by_request(url, ("a", "div")):
+                class_ = element.get("class", "")
+                if element.tag == "div" and _is_results_column(element):
+                    return pdf_tag_list
+
+                if (
+                    element.tag == "a"
+                    and "pdf-download" in class_
+                    and "/downloadpdf/" in element.get("href", "")
+                    and any(_is_results_column(ancestor) for ancestor in element.iterancestors("div"))
+                ):
+                    pdf_tag_list.append(Tag(name="a", attrs=dict(element.attrib)))
+        except Exception as e:
+            self._logger.warning(f"Failed to stream URL {url}. Error: {e}")
+
+        return None
+
+    def __render_page(self, url: str) -> ResultSet:
+        """
+        Render the page in the browser and collect the PDF links.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            ResultSet: A ResultSet (i.e., a list) of Tag objects containing the PDF links.
+        """
+        scraper = self._scrape_url(url)
+
+        if not (results_column := _RESULTS_COLUMN_SELECTOR.select_one(scraper)):
+            raise Exception(f"Results not found in URL {url}")
+
+        # search the results column only, instead of the whole page (header, navigation, footer, etc.)
+        return _PDF_LINK_SELECTOR.select(results_column)
+
     def _is_valid_tag_list(self, page_tag_list: List | None) -> bool:
         return page_tag_list is not None
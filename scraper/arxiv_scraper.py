@@ -1,10 +1,18 @@
-from typing import Type, List
-from bs4 import ResultSet, Tag
+import re
+from typing import Type, List, Tuple
+from bs4 import Tag
+import requests
+import soupsieve
 
-from helper.utils import get_scraped_url_by_bs_tag
+from helper.utils import get_scraped_url
 from model.arxiv_models import ArxivConfig
 from model.base_pagination_publisher_models import BasePaginationPublisherScrapeOutput
 from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScraper
+from scraper.base_scraper import LINKS_ONLY
+
+_PDF_LINK_SELECTOR = soupsieve.compile('a[href*="/pdf/"]')
+# e.g., "Showing 1–100 of 12,345 results for all: ..."
+_TOTAL_RESULTS_RE = re.compile(r"of\s+([\d,]+)\s+results")
 
 
 class ArxivScraper(BasePaginationPublisherScraper):
@@ -17,24 +25,31 @@ class ArxivScraper(BasePaginationPublisherScraper):
         return ArxivConfig
 
     def scrape(self) -> BasePaginationPublisherScrapeOutput | None:
-        pdf_tags = []
+        # the same paper can be listed by several sources, hence build the URL of each PDF link once
+        pdf_hrefs = {}
         for idx, source in enumerate(self._config_model.sources):
             self.__page_size = source.page_size
-            pdf_tags.extend(self._scrape_landing_page(source.landing_page_url, idx + 1))
+            pdf_hrefs.update(dict.fromkeys(tag.get("href") for tag in self._scrape_landing_page(
+                source.landing_page_url, idx + 1
+            )))
 
         return {"Arxiv": [
-            get_scraped_url_by_bs_tag(tag, self._config_model.base_url) for tag in pdf_tags
-        ]} if pdf_tags else None
+            get_scraped_url(href, self._config_model.base_url) for href in pdf_hrefs
+        ]} if pdf_hrefs else None
 
     def _scrape_landing_page(self, landing_page_url: str, source_number: int) -> List[Tag]:
-        return self._scrape_pagination(landing_page_url, source_number, base_zero=True, page_size=self.__page_size)
+        return self._scrape_pagination_by_request(
+            landing_page_url, source_number, self._request_page, base_zero=True, page_size=self.__page_size
+        )
 
-    def _scrape_page(self, url: str) -> ResultSet | None:
+    def _scrape_page(self, url: str) -> List[Tag] | None:
         try:
-            scraper = self._scrape_url(url)
+            # the listing pages are server-rendered, hence stream them with a plain HTTP request first and fall back to
+            # the browser only if the request failed
+            if (pdf_tag_list := self._request_page(url)[0]) is not None:
+                return pdf_tag_list
 
-            # Now, visit each article link and find the PDF link
-            if not (pdf_tag_list := scraper.find_all("a", href=lambda href: href and "/pdf/" in href)):
+            if not (pdf_tag_list := _PDF_LINK_SELECTOR.select(self._scrape_url(url, parse_only=LINKS_ONLY))):
                 self._save_failure(url)
 
             self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
@@ -42,3 +57,34 @@ class ArxivScraper(BasePaginationPublisherScraper):
         except Exception as e:
             self._log_and_save_failure(url, f"Failed to process URL {url}. Error: {e}")
             return None
+
+    def _request_page(self, url: str) -> Tuple[List[Tag] | None, int | None]:
+        # stream the page, keeping the PDF links and the title only, instead of building the whole tree
+        pdf_tag_list = []
+        total_results = None
+        try:
+            for element in self._iter_elements_by_request(url, ("a", "h1")):
+                if element.tag == "a" and "/pdf/" in (href := element.get("href", "")):
+                    pdf_tag_list.append(Tag(name="a", attrs={"href": href}))
+                elif element.tag == "h1" and "title" in element.get("class", "").split():
+                    match = _TOTAL_RESULTS_RE.search(" ".join("".join(element.itertext()).split()))
+                    total_results = int(match.group(1).replace(",", "")) if match else None
+        except requests.HTTPError as e:
+            # a client error (e.g., the 404 past the last listing page) is definitive, hence it ends the pagination
+            # instead of rendering the page again in the browser; only the transient errors fall back to the browser
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code is None or status_code >= 500 or status_code in (408, 429):
+                self._logger.warning(f"Failed to stream URL {url}. Error: {e}")
+                return None, None
+
+            self._log_and_save_failure(url, f"Failed to process URL {url}. Error: {e}")
+            return [], None
+        except Exception as e:
+            self._logger.warning(f"Failed to stream URL {url}. Error: {e}")
+            return None, None
+
+        if not pdf_tag_list:
+            self._save_failure(url)
+
+        self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
+        return pdf_tag_list, total_results
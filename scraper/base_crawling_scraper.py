@@ -1,15 +1,11 @@
 from abc import abstractmethod
 import os
-import random
-import time
 from typing import Type, List
-from scrapy.crawler import CrawlerProcess
 
 from helper.constants import DEFAULT_CRAWLING_FOLDER
 from model.base_crawling_models import BaseCrawlingConfig, BaseCrawlingScraperOutput
 from model.sql_models import ScraperFailure
 from scraper.base_scraper import BaseScraper
-from service.crawler import EveSpider
 
 
 class BaseCrawlingScraper(BaseScraper):
@@ -29,12 +25,17 @@ class BaseCrawlingScraper(BaseScraper):
             self._logger.error("No start URLs provided in the configuration model.")
             return None
 
-        process = CrawlerProcess()
+        # scrapy is imported only by the crawling scrapers, when they run
+        from service.crawler import EveSpider, crawl
 
         self._logger.info("Starting the crawling process.")
-        process.crawl(EveSpider, start_urls=start_urls, download_folder_path=self._get_crawling_folder_path())
-        process.start()
-        process.join()
+        crawling_folder = self._get_crawling_folder_path()
+        crawl(
+            EveSpider,
+            settings={"HTTPCACHE_DIR": os.path.join(crawling_folder, ".httpcache")},
+            start_urls=start_urls,
+            download_folder_path=crawling_folder,
+        )
 
         # log the end of the crawling process
         self._logger.info("Crawling process completed successfully.")
@@ -51,23 +52,13 @@ class BaseCrawlingScraper(BaseScraper):
         self._logger.debug("Uploading files to S3")
         crawling_folder = self._get_crawling_folder_path()
 
-        file_paths = [
-            os.path.join(crawling_folder, file)
-            for file in os.listdir(crawling_folder)
-            if os.path.isfile(os.path.join(crawling_folder, file))
-        ]
+        with os.scandir(crawling_folder) as entries:
+            file_paths = [entry.path for entry in entries if entry.is_file()]
         if not file_paths:
             for source_link in sources_links:
                 self._save_failure(source_link, f"No files found in the crawling folder: {source_link}")
 
-        for file_path in file_paths:
-            current_resource = self._uploaded_resource_repository.get_by_content(
-                self._logging_db_scraper, self._config_model.bucket_key, file_path
-            )
-            self._upload_resource_to_s3(current_resource, file_path.replace(crawling_folder, ""))
-
-            # Sleep after each successful upload to avoid overwhelming the server
-            time.sleep(random.uniform(2, 5))
+        self._upload_files_to_s3(file_paths, crawling_folder)
 
     def _get_crawling_folder_path(self) -> str:
         return os.path.join(DEFAULT_CRAWLING_FOLDER, self.crawling_folder_path)
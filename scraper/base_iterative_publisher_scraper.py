@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import os
+from typing import List, Dict, Tuple
 
+from helper.utils import dump_json, get_user_agent
 from model.base_iterative_publisher_models import (
     BaseIterativePublisherJournal,
     BaseIterativeWithConstraintPublisherJournal,
@@ -9,22 +13,59 @@ from model.base_iterative_publisher_models import (
     IterativePublisherScrapeIssueOutput,
     IterativePublisherScrapeOutput,
 )
+from model.sql_models import ScrapedArticle, ScrapedIssue
+from repository.scraped_article_repository import ScrapedArticleRepository
+from repository.scraped_issue_repository import ScrapedIssueRepository
 from scraper.base_scraper import BaseScraper
 
 
 class BaseIterativePublisherScraper(BaseScraper):
+    def __init__(self):
+        super().__init__()
+
+        self._scraped_article_repository = ScrapedArticleRepository()
+        self._article_links: Dict[str, str] = {}
+
+        self._scraped_issue_repository = ScrapedIssueRepository()
+        self._issue_links: Dict[Tuple[str, int, int], IterativePublisherScrapeIssueOutput] = {}
+        self._journal_ids: Dict[Tuple[str, str], str] = {}
+
     def scrape(self) -> IterativePublisherScrapeOutput | None:
         """
-        Scrape the journals for PDF links.
+        Scrape the journals for PDF links. The issues scraped by a previous run which was interrupted are not scraped
+        again, but their PDF links are reused.
+        The journals are scraped one at a time, unless `ITERATIVE_SCRAPE_PARALLEL` sets more workers: this is suitable
+        only for the derived classes whose `_scrape_journal` performs plain HTTP requests, since the browser driver
+        cannot be used by several threads. Otherwise, the journals scraped with the browser are spread across a pool of
+        browsers, if `BROWSER_POOL_SIZE` is greater than 1 (see `_map_with_browsers`).
 
         Returns:
             IterativePublisherScrapeOutput | None: A dictionary containing the PDF links, or None if no link was found.
         """
-        links = {}
+        self._issue_links = {
+            (record.journal, record.volume, record.issue): record.output_json
+            for record in self._scraped_issue_repository.get_by({"scraper": self._logging_db_scraper})
+        }
+        if self._issue_links:
+            self._logger.info(f"Resuming from {len(self._issue_links)} issues already scraped")
+
+        journals = self._config_model.journals
+        max_workers = int(os.getenv("ITERATIVE_SCRAPE_PARALLEL", "1"))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                journals_links = list(executor.map(self._scrape_journal, journals))
+        else:
+            journals_links = self._map_with_browsers(self._scrape_journal, journals)
+
+        links = {
+            self._get_journal_id(journal): scraped_tags
+            for journal, scraped_tags in zip(journals, journals_links)
+            if scraped_tags
+        }
 
-        for journal in self._config_model.journals:
-            if scraped_tags := self._scrape_journal(journal):
-                links[self.journal_identifier(journal)] = scraped_tags
+        # the run is complete, hence the next one must start from scratch
+        self._scraped_issue_repository.delete_by({"scraper": self._logging_db_scraper})
+        self._issue_links = {}
 
         return links if links else None
 
@@ -36,29 +77,60 @@ class BaseIterativePublisherScraper(BaseScraper):
             scrape_output: A dictionary containing the PDF links.
 
         Returns:
-            List[str]: A list of strings containing the PDF links
+            List[str]: A list of the distinct PDF links, in order
         """
-        return list(set([
-            issue_link
-            for journal_links in scrape_output.values()
-            for volume_links in journal_links.values()
-            for issues_links in volume_links.values()
-            for issue_link in issues_links
-        ]))
+        issues_links = chain.from_iterable(journal_links.values() for journal_links in scrape_output.values())
+        return list(dict.fromkeys(chain.from_iterable(issues_links)))
 
     def _build_journal_links(self, journal: BaseIterativePublisherJournal) -> IterativePublisherScrapeJournalOutput:
-        return {
-            volume_num: self._scrape_volume(journal, volume_num)
-            for volume_num in range(journal.start_volume, journal.end_volume + 1)
-        }
+        links = {}
+        scrape_volume = self._scrape_volume
+        for volume_num in range(journal.start_volume, journal.end_volume + 1):
+            if volume_links := scrape_volume(journal, volume_num):
+                self._add_volume_links(links, volume_num, volume_links)
+
+        return links
+
+    def _add_volume_links(
+        self,
+        links: IterativePublisherScrapeJournalOutput,
+        volume_num: int,
+        volume_links: IterativePublisherScrapeVolumeOutput,
+    ):
+        """
+        Flatten the issues of a volume into the journal links, keyed by "{volume}/{issue}". The issues without any PDF
+        link are not stored, so that the output of sparse journals stays small.
+
+        Args:
+            links (IterativePublisherScrapeJournalOutput): The journal links to update.
+            volume_num (int): The volume number.
+            volume_links (IterativePublisherScrapeVolumeOutput): The PDF links of the volume, for each issue.
+        """
+        links.update(
+            (f"{volume_num}/{issue_num}", issue_links) for issue_num, issue_links in volume_links.items() if issue_links
+        )
 
     def _build_volume_links(
         self, journal: BaseIterativePublisherJournal, volume_num: int
     ) -> IterativePublisherScrapeVolumeOutput:
+        # probe all the issues of the volume not scraped yet concurrently, then scrape the existing ones one at a time,
+        # since the browser is shared
+        journal_id = self._get_journal_id(journal)
+        issue_nums = range(journal.start_issue, journal.end_issue + 1)
+        pending_issue_nums = [
+            issue_num for issue_num in issue_nums if (journal_id, volume_num, issue_num) not in self._issue_links
+        ]
+        issues_exist = dict(zip(pending_issue_nums, self._map_concurrently(
+            lambda issue_num: self._issue_exists(self._get_issue_url(journal, volume_num, issue_num)),
+            pending_issue_nums,
+        )))
+
         return {
             issue_num: scrape_issue_result
-            for issue_num in range(journal.start_issue, journal.end_issue + 1)
-            if (scrape_issue_result := self._scrape_issue(journal, volume_num, issue_num))
+            for issue_num in issue_nums
+            if (scrape_issue_result := self._get_issue_links(
+                journal, volume_num, issue_num, issue_exists=issues_exist.get(issue_num)
+            ))
         }
 
     def _scrape_journal(self, journal: BaseIterativePublisherJournal) -> IterativePublisherScrapeJournalOutput:
@@ -69,7 +141,7 @@ class BaseIterativePublisherScraper(BaseScraper):
             journal (BaseIterativePublisherJournal): The journal to scrape.
 
         Returns:
-            IterativePublisherScrapeJournalOutput: A dictionary containing the PDF links.
+            IterativePublisherScrapeJournalOutput: A dictionary containing the PDF links, for each "{volume}/{issue}".
         """
         self._logger.info(f"Processing Journal {journal.name}")
         return self._build_journal_links(journal)
@@ -90,6 +162,188 @@ class BaseIterativePublisherScraper(BaseScraper):
         self._logger.info(f"Processing Volume {volume_num}")
         return self._build_volume_links(journal, volume_num)
 
+    def _get_journal_id(self, journal: BaseIterativePublisherJournal) -> str:
+        """
+        Return the journal identifier, computing it only once per journal, since it is needed for each issue.
+
+        Args:
+            journal (BaseIterativePublisherJournal): The journal.
+
+        Returns:
+            str: The journal identifier
+        """
+        key = (journal.name, journal.url)
+        if (journal_id := self._journal_ids.get(key)) is None:
+            journal_id = self._journal_ids[key] = self.journal_identifier(journal)
+
+        return journal_id
+
+    def _get_issue_links(
+        self,
+        journal: BaseIterativePublisherJournal,
+        volume_num: int,
+        issue_num: int,
+        issue_exists: bool | None = None,
+    ) -> IterativePublisherScrapeIssueOutput | None:
+        """
+        Retrieve the PDF links of an issue, reusing the ones of a previous interrupted run, if any. Otherwise, scrape the
+        issue, if it exists, and keep track of its PDF links, so that a run interrupted later does not scrape it again.
+
+        Args:
+            journal (BaseIterativePublisherJournal): The journal to scrape.
+            volume_num (int): The volume number.
+            issue_num (int): The issue number.
+            issue_exists (bool | None): Whether the issue exists, if already probed; if None, the issue is probed.
+
+        Returns:
+            IterativePublisherScrapeIssueOutput | None: A list of PDF links found in the issue, or None if something went wrong.
+        """
+        journal_id = self._get_journal_id(journal)
+        if (links := self._issue_links.get((journal_id, volume_num, issue_num))) is not None:
+            return links
+
+        if issue_exists is None:
+            issue_exists = self._issue_exists(self._get_issue_url(journal, volume_num, issue_num))
+        if not issue_exists:
+            return None
+
+        if links := self._scrape_issue(journal, volume_num, issue_num):
+            self._scraped_issue_repository.insert(ScrapedIssue(
+                scraper=self._logging_db_scraper,
+                journal=journal_id,
+                volume=volume_num,
+                issue=issue_num,
+                output=dump_json(links),
+            ))
+
+        return links
+
+    def _issue_exists(self, issue_url: str, timeout: int | None = 10) -> bool:
+        """
+        Probe the issue URL with a HEAD request, so that non-existing issues can be skipped without loading and parsing
+        the whole page. Any outcome other than a "not found" response is considered as existing, since some publishers
+        reject HEAD requests coming from non-browser clients. The "not found" outcomes are cached, so that the next runs
+        do not probe the missing issues again, unless forced: the issues announced but not yet published are probed
+        again, and their cached outcome is dropped once they are found.
+
+        Args:
+            issue_url (str): The issue URL.
+            timeout (int): The timeout of the request, in seconds.
+
+        Returns:
+            bool: False if the issue does not exist, True otherwise.
+        """
+        cached_not_found = (cached := self._page_cache.get(issue_url)) is not None and cached[0] == 404
+        if cached_not_found and not self._force:
+            self._logger.info(f"Issue URL {issue_url} not found in a previous run, skipping.")
+            return False
+
+        try:
+            response = self._request(
+                "HEAD", issue_url, headers={"User-Agent": get_user_agent()}, allow_redirects=True, timeout=timeout
+            )
+        except Exception:
+            response = None
+
+        if response is not None and response.status_code in (404, 410):
+            self._page_cache.set(issue_url, 404, b"")
+            self._logger.info(f"Issue URL {issue_url} not found, skipping.")
+            return False
+
+        if cached_not_found:
+            self._page_cache.delete(issue_url, 404)
+        return True
+
+    def _get_article_link(self, article_url: str) -> str | None:
+        """
+        Retrieve the PDF link of an article, by looking it up in the in-memory cache first, then in the database, and
+        by scraping the article only if it has never been processed before. On forced runs, the links stored by the
+        previous runs are not reused: the articles are scraped again, and their stored links updated.
+
+        Args:
+            article_url (str): The article URL.
+
+        Returns:
+            str | None: The string containing the PDF link, or None if no link was found.
+        """
+        if pdf_link := self.__get_known_article_link(article_url):
+            return pdf_link
+
+        if not (pdf_link := self._scrape_article(article_url)):
+            return None
+
+        self.__store_article_link(article_url, pdf_link)
+        return pdf_link
+
+    def _get_article_links(self, article_urls: List[str]) -> List[str]:
+        """
+        Retrieve the PDF links of several articles, as `_get_article_link` does, but scraping all the articles never
+        processed before in a single batch.
+
+        Args:
+            article_urls (List[str]): The article URLs.
+
+        Returns:
+            List[str]: The PDF links found, in the same order of the article URLs.
+        """
+        missing_urls = [url for url in dict.fromkeys(article_urls) if not self.__get_known_article_link(url)]
+        for article_url, pdf_link in self._scrape_articles(missing_urls).items():
+            if pdf_link:
+                self.__store_article_link(article_url, pdf_link)
+
+        return [pdf_link for url in article_urls if (pdf_link := self._article_links.get(url))]
+
+    def _scrape_articles(self, article_urls: List[str]) -> Dict[str, str | None]:
+        """
+        Scrape several articles. By default, they are scraped one by one; derived classes can override this method to
+        scrape them concurrently.
+
+        Args:
+            article_urls (List[str]): The article URLs to scrape.
+
+        Returns:
+            Dict[str, str | None]: The PDF link of each article, or None if no link was found.
+        """
+        return {article_url: self._scrape_article(article_url) for article_url in article_urls}
+
+    def __get_known_article_link(self, article_url: str) -> str | None:
+        if article_url in self._article_links:
+            return self._article_links[article_url]
+
+        if not self._force and (record := self._scraped_article_repository.get_one_by(
+            {"scraper": self._logging_db_scraper, "source": article_url}
+        )):
+            self._article_links[article_url] = record.pdf_link
+            return record.pdf_link
+
+        return None
+
+    def __store_article_link(self, article_url: str, pdf_link: str):
+        self._article_links[article_url] = pdf_link
+        record = ScrapedArticle(scraper=self._logging_db_scraper, source=article_url, pdf_link=pdf_link)
+        if self._force:
+            # the link stored by a previous run, if any, is replaced
+            self._scraped_article_repository.upsert(
+                record, {"scraper": record.scraper, "source": record.source}, {"pdf_link": record.pdf_link}
+            )
+        else:
+            self._scraped_article_repository.insert(record)
+
+    @abstractmethod
+    def _get_issue_url(self, journal: BaseIterativePublisherJournal, volume_num: int, issue_num: int) -> str:
+        """
+        Build the issue URL. This method must be implemented in the derived class.
+
+        Args:
+            journal (BaseIterativePublisherJournal): The journal to scrape.
+            volume_num (int): The volume number.
+            issue_num (int): The issue number.
+
+        Returns:
+            str: The issue URL.
+        """
+        pass
+
     @abstractmethod
     def _scrape_issue(
         self, journal: BaseIterativePublisherJournal, volume_num: int, issue_num: int
@@ -135,9 +389,12 @@ class BaseIterativePublisherScraper(BaseScraper):
 
 
 class BaseIterativeWithConstraintPublisherScraper(BaseIterativePublisherScraper, ABC):
-    def _build_journal_links(self, journal: BaseIterativeWithConstraintPublisherJournal):
+    def _build_journal_links(
+        self, journal: BaseIterativeWithConstraintPublisherJournal
+    ) -> IterativePublisherScrapeJournalOutput:
         missing_volume_count = 0  # Track consecutive missing volumes
         links = {}
+        scrape_volume = self._scrape_volume
 
         # Iterate over each volume in the specified range
         for volume_num in range(journal.start_volume, journal.end_volume + 1):
@@ -145,9 +402,9 @@ class BaseIterativeWithConstraintPublisherScraper(BaseIterativePublisherScraper,
                 self._logger.warning(f"Max consecutive missing volumes for Journal {journal.name} reached. Moving to the next journal.")
                 break  # Exit loop and move to the next journal
 
-            if res := self._scrape_volume(journal, volume_num):
+            if res := scrape_volume(journal, volume_num):
                 missing_volume_count = 0
-                links[volume_num] = res
+                self._add_volume_links(links, volume_num, res)
                 continue
 
             missing_volume_count += 1
@@ -159,6 +416,7 @@ class BaseIterativeWithConstraintPublisherScraper(BaseIterativePublisherScraper,
     ) -> IterativePublisherScrapeVolumeOutput:
         missing_issue_count = 0  # Track consecutive missing issues
         links = {}
+        get_issue_links = self._get_issue_links
 
         # Iterate over each issue in the specified range
         for issue_num in range(journal.start_issue, journal.end_issue + 1):
@@ -166,7 +424,7 @@ class BaseIterativeWithConstraintPublisherScraper(BaseIterativePublisherScraper,
                 self._logger.warning(f"Max consecutive missing issues for Volume {volume_num} reached. Moving to the next volume.")
                 break  # Exit loop and move to the next volume
 
-            res = self._scrape_issue(journal, volume_num, issue_num)
+            res = get_issue_links(journal, volume_num, issue_num)
             if self._has_valid_results_from_issue(res):
                 missing_issue_count = 0
                 links[issue_num] = res
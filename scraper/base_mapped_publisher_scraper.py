@@ -1,9 +1,11 @@
-import random
-import time
 from abc import abstractmethod
-from typing import List, Type, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import os
+from typing import List, Type, Dict, Any, Generator
 
-from model.base_mapped_models import BaseMappedConfig
+from helper.utils import get_bool_env, get_sb_configuration
+from model.base_mapped_models import BaseMappedConfig, BaseMappedSource
 from model.sql_models import ScraperFailure
 from scraper.base_scraper import BaseScraper, BaseMappedSubScraper
 from service.adapter import ScrapeAdapter
@@ -15,6 +17,9 @@ class BaseMappedPublisherScraper(BaseScraper):
 
         self._bucket_keys = {}
         self._files_by_request = {}
+        self._adapters: Dict[str, ScrapeAdapter] = {}
+        self._resolved_mapping: Dict[str, Type[BaseMappedSubScraper]] | None = None
+        self._uploaded_sources = set()
 
     def _run_scraping(self) -> Any | None:
         return self.scrape()
@@ -42,31 +47,94 @@ class BaseMappedPublisherScraper(BaseScraper):
 
     def scrape(self) -> Dict[str, List[str] | Dict[str, List[str]]] | None:
         """
-        Scrape the resources links.
+        Scrape the resources links. The sources are scraped one at a time, unless `MAPPED_SCRAPE_PARALLEL` sets more
+        workers: each source is scraped with its own browser, hence they can be scraped concurrently, at the cost of
+        running one browser per worker.
+        The files of the sources retrieved by plain HTTP requests are uploaded in background as soon as each source is
+        scraped, while the next sources are scraped, unless `MAPPED_PIPELINE_UPLOADS` is disabled.
 
         Returns:
             Dict[str, List | Dict]: The output of the scraping.
         """
+        pipeline_uploads = get_bool_env("MAPPED_PIPELINE_UPLOADS", "true")
+
         links = {}
-        for source in self._config_model.sources:
-            self._logger.info(f"Processing source {source.name}")
+        with ThreadPoolExecutor(max_workers=1) as upload_executor:
+            sources = self._config_model.sources
+            for source, results in zip(sources, self.__scrape_sources(sources)):
+                if results is None:
+                    continue
 
-            results = ScrapeAdapter(source.config, self.__class__.__name__, self.mapping.get(source.scraper)).scrape()
-            if results is not None:
                 links[source.name] = results
-                self._bucket_keys[source.name] = f"{self._config_model.bucket_key}/{source.config.bucket_key or ''}".rstrip("/")
-                self._files_by_request[source.name] = source.config.files_by_request or self._config_model.files_by_request
+                self._bucket_keys[source.name] = (
+                    f"{self._config_model.bucket_key}/{source.config.bucket_key or ''}".rstrip("/")
+                )
+                self._files_by_request[source.name] = (
+                    source.config.files_by_request or self._config_model.files_by_request
+                )
+
+                if pipeline_uploads and self._files_by_request[source.name]:
+                    upload_executor.submit(self.__upload_source, source, results)
 
         return links if links else None
 
+    def __scrape_sources(
+        self, sources: List[BaseMappedSource]
+    ) -> Generator[List[str] | Dict[str, List[str]] | None, None, None]:
+        max_workers = min(int(os.getenv("MAPPED_SCRAPE_PARALLEL", "1")), len(sources))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(self.__scrape_source, sources)
+            return
+
+        # the sources scraped one at a time share a single browser, started when the first source needs it, instead
+        # of starting a new browser for each source
+        from seleniumbase import SB
+
+        with ExitStack() as stack:
+            driver = None
+            for source in sources:
+                if driver is None and self.__get_adapter(source).requires_browser:
+                    driver = stack.enter_context(SB(**get_sb_configuration(self.__class__.__name__)))
+                    driver.activate_cdp_mode()
+                    driver.cdp.maximize()
+
+                yield self.__scrape_source(source, driver)
+
+    def __scrape_source(
+        self, source: BaseMappedSource, driver: Any | None = None
+    ) -> List[str] | Dict[str, List[str]] | None:
+        self._logger.info(f"Processing source {source.name}")
+        return self.__get_adapter(source).scrape(driver)
+
+    def __upload_source(self, source: BaseMappedSource, results: List[str] | Dict[str, List[str]]):
+        # the source is marked as uploaded only if the upload completed, otherwise `upload_to_s3` uploads it again
+        try:
+            adapter = self.__get_adapter(source)
+            adapter.upload_to_s3(
+                adapter.post_process(results), self._bucket_keys[source.name], self._files_by_request[source.name]
+            )
+            self._uploaded_sources.add(source.name)
+        except Exception as e:
+            self._logger.error(f"Failed to upload the files of source {source.name}. Error: {e}")
+
+    def __get_adapter(self, source: BaseMappedSource) -> ScrapeAdapter:
+        # one adapter per source, shared by all the phases of the scraping; the mapping is built once, since the
+        # derived classes build it at each access
+        if (adapter := self._adapters.get(source.name)) is None:
+            if self._resolved_mapping is None:
+                self._resolved_mapping = self.mapping
+            adapter = self._adapters[source.name] = ScrapeAdapter(
+                source.config, self.__class__.__name__, self._resolved_mapping.get(source.scraper)
+            )
+        return adapter
+
     def scrape_failure(self, failure: ScraperFailure) -> List[str]:
         links = []
         for source in self._config_model.sources:
             self._logger.info(f"Processing source {source.name}")
 
-            results = ScrapeAdapter(
-                source.config, self.__class__.__name__, self.mapping.get(source.scraper)
-            ).scrape_failure(failure)
+            results = self.__get_adapter(source).scrape_failure(failure)
             links.extend(results)
 
         return links
@@ -83,9 +151,7 @@ class BaseMappedPublisherScraper(BaseScraper):
             Dict[str, List[str]]: The results of the scraping
         """
         return {
-            source.name: ScrapeAdapter(
-                source.config, self.__class__.__name__, self.mapping.get(source.scraper)
-            ).post_process(scrape_output[source.name])
+            source.name: self.__get_adapter(source).post_process(scrape_output[source.name])
             for source in self._config_model.sources if source.name in scrape_output
         }
 
@@ -94,14 +160,15 @@ class BaseMappedPublisherScraper(BaseScraper):
             if source.name not in sources_links:
                 continue
 
-            ScrapeAdapter(source.config, self.__class__.__name__, self.mapping.get(source.scraper)).upload_to_s3(
+            if source.name in self._uploaded_sources:
+                self._logger.info(f"Files of source {source.name} already uploaded while scraping, skipping.")
+                continue
+
+            self.__get_adapter(source).upload_to_s3(
                 sources_links[source.name],
                 self._bucket_keys[source.name],
                 self._files_by_request[source.name],
             )
 
-            # Sleep after each successful upload to avoid overwhelming the server
-            time.sleep(random.uniform(2, 5))
-
     def raw_upload_to_s3(self, sources_links: List[str]):
         super().upload_to_s3(sources_links)
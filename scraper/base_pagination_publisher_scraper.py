@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import List
+from collections import ChainMap, deque
+from itertools import chain, count, islice, takewhile
+from typing import Callable, List, Tuple
 from bs4 import ResultSet, Tag
 
 from helper.utils import get_scraped_url_by_bs_tag
@@ -13,7 +15,8 @@ class BasePaginationPublisherScraper(BaseScraper):
         self, base_url: str, source_number: int, base_zero: bool = False, **kwargs
     ) -> List[Tag]:
         """
-        Scrape the pagination URL for PDF links.
+        Scrape the pagination URL for PDF links. The pagination stops at the first empty page, at the first page
+        repeating the previous one, or after `max_pages` pages (default 1000), if passed among the keyword arguments.
 
         Args:
             base_url (str): The base URL to scrape.
@@ -24,36 +27,152 @@ class BasePaginationPublisherScraper(BaseScraper):
             List[Tag]: A list of Tag objects containing the tags to the PDF links.
         """
         page_number = 0 if base_zero else 1
-        page_size = kwargs.get("page_size", 50)
-        max_allowed_papers = kwargs.get("max_allowed_papers")
+        build_page_url = self.__get_page_url_builder(base_url, source_number, base_zero, **kwargs)
+        max_pages = kwargs.get("max_pages", 1000)
 
         pdf_tag_list = []
-        while True:
-            start_index = (page_number if base_zero else page_number - 1) * page_size
-            if max_allowed_papers is not None and start_index >= max_allowed_papers:
+        seen_fingerprint = None
+        for _ in range(max_pages):
+            if not (page_url := build_page_url(page_number)):
                 break
 
-            # parse the query with parameters
-            # they are enclosed in curly braces, must be replaced with the actual values
-            # "page_number", "source_number" and "start_index" are reserved keywords
-            page_url = base_url.format(**(kwargs | {
-                "page_number": page_number,
-                "source_number": source_number,
-                "start_index": start_index,
-                "page_size": page_size
-            }))
-
             self._logger.info(f"Processing Page {page_url}")
 
             page_tag_list = self._scrape_page(page_url)
             if not self._is_valid_tag_list(page_tag_list):
                 break
 
-            pdf_tag_list.extend(page_tag_list)
+            # some paginators loop back to the first page, or keep returning the same page, after the last one
+            if (fingerprint := self.__get_fingerprint(page_tag_list)) == seen_fingerprint:
+                self._logger.warning(f"Page {page_url} repeats the previous page, stopping the pagination")
+                break
+            seen_fingerprint = fingerprint
+
+            pdf_tag_list.extend(self.__detach_tags(page_tag_list))
             page_number += 1
+        else:
+            self._logger.warning(f"Pagination of {base_url} stopped after {max_pages} pages")
+
+        return pdf_tag_list
+
+    def _scrape_pagination_by_request(
+        self,
+        base_url: str,
+        source_number: int,
+        request_page: Callable[[str], Tuple[ResultSet | List[Tag] | None, int | None]],
+        base_zero: bool = False,
+        prefetch: int = 4,
+        **kwargs,
+    ) -> List[Tag]:
+        """
+        Scrape the pagination URL for PDF links, as `_scrape_pagination` does, but for server-rendered pages fetched
+        with plain HTTP requests by `request_page`. The pages whose request failed are scraped by `_scrape_page`
+        instead.
+        The pages are processed in order, while a window of the next ones is already being fetched concurrently, until
+        an empty page. If the first page states the total number of results, no page past them is requested.
+
+        Args:
+            base_url (str): The base URL to scrape.
+            source_number (int): The source number.
+            request_page (Callable[[str], Tuple[ResultSet | List[Tag] | None, int | None]]): The function fetching the page with a plain HTTP request and finding the PDF links, or returning None if the request failed, together with the total number of results stated by the page, or None if unknown.
+            base_zero (bool): If the page number is base zero. Default is False.
+            prefetch (int): The number of pages to fetch ahead. Default is 4.
+
+        Returns:
+            List[Tag]: A list of Tag objects containing the tags to the PDF links.
+        """
+        page_number = 0 if base_zero else 1
+        if not (page_url := self.__get_page_url_builder(base_url, source_number, base_zero, **kwargs)(page_number)):
+            return []
+
+        page_tag_list, total_results = request_page(page_url)
+        if not self._is_valid_tag_list(page_tag_list := self.__process_page(page_url, page_tag_list)):
+            return []
+
+        pdf_tag_list = self.__detach_tags(page_tag_list)
+
+        if total_results is not None:
+            max_allowed_papers = kwargs.get("max_allowed_papers")
+            kwargs["max_allowed_papers"] = min(total_results, max_allowed_papers or total_results)
+
+        build_page_url = self.__get_page_url_builder(base_url, source_number, base_zero, **kwargs)
+        page_urls = islice(
+            takewhile(bool, map(build_page_url, count(page_number + 1))), kwargs.get("max_pages", 1000) - 1
+        )
+        in_flight = deque(
+            (page_url, self._submit_concurrently(request_page, page_url))
+            for page_url in islice(page_urls, prefetch)
+        )
+        seen_fingerprint = self.__get_fingerprint(page_tag_list)
+        while in_flight:
+            page_url, future = in_flight.popleft()
+            page_tag_list = self.__process_page(page_url, future.result()[0])
+            if (
+                not self._is_valid_tag_list(page_tag_list)
+                or (fingerprint := self.__get_fingerprint(page_tag_list)) == seen_fingerprint
+            ):
+                for _, pending in in_flight:
+                    pending.cancel()
+                break
+
+            seen_fingerprint = fingerprint
+            pdf_tag_list.extend(self.__detach_tags(page_tag_list))
+            if page_url := next(page_urls, None):
+                in_flight.append((page_url, self._submit_concurrently(request_page, page_url)))
 
         return pdf_tag_list
 
+    def __process_page(
+        self, page_url: str, page_tag_list: ResultSet | List[Tag] | None
+    ) -> ResultSet | List[Tag] | None:
+        self._logger.info(f"Processing Page {page_url}")
+        return page_tag_list if page_tag_list is not None else self._scrape_page(page_url)
+
+    def __detach_tags(self, page_tag_list: ResultSet | List[Tag]) -> List[Tag]:
+        # the tags of a page keep its whole parsed document alive: only standalone copies of their attributes are
+        # accumulated, so that the document of each page can be freed as soon as the page is processed
+        return [Tag(name=tag.name, attrs=dict(tag.attrs)) for tag in page_tag_list]
+
+    def __get_fingerprint(self, page_tag_list: ResultSet | List[Tag]) -> int:
+        # the first tags are a cheap proxy of the identity of a page
+        return hash(tuple(str(tag) for tag in page_tag_list[:5]))
+
+    def __get_page_url_builder(
+        self, base_url: str, source_number: int, base_zero: bool, **kwargs
+    ) -> Callable[[int], str | None]:
+        """
+        Get the function building the URL of a page of the pagination. The values of the fields which do not depend on
+        the page are gathered once, and only the page-dependent ones are looked up on top of them for each page.
+
+        Args:
+            base_url (str): The base URL to scrape.
+            source_number (int): The source number.
+            base_zero (bool): If the page number is base zero.
+
+        Returns:
+            Callable[[int], str | None]: The function building the URL of the page with the given number, or returning
+            None if the page exceeds the maximum number of allowed papers.
+        """
+        page_size = kwargs.get("page_size", 50)
+        max_allowed_papers = kwargs.get("max_allowed_papers")
+        first_page_number = 0 if base_zero else 1
+
+        # parse the query with parameters
+        # they are enclosed in curly braces, must be replaced with the actual values
+        # "page_number", "source_number" and "start_index" are reserved keywords
+        static_values = kwargs | {"source_number": source_number, "page_size": page_size}
+
+        def build_page_url(page_number: int) -> str | None:
+            start_index = (page_number - first_page_number) * page_size
+            if max_allowed_papers is not None and start_index >= max_allowed_papers:
+                return None
+
+            return base_url.format_map(
+                ChainMap({"page_number": page_number, "start_index": start_index}, static_values)
+            )
+
+        return build_page_url
+
     def post_process(self, scrape_output: BasePaginationPublisherScrapeOutput) -> List[str]:
         """
         Extract the href attribute from the links.
@@ -64,7 +183,7 @@ class BasePaginationPublisherScraper(BaseScraper):
         Returns:
             List[str]: A list of strings containing the PDF links
         """
-        return list(set([link for links in scrape_output.values() for link in links]))
+        return list(dict.fromkeys(chain.from_iterable(scrape_output.values())))
 
     def _is_valid_tag_list(self, page_tag_list: List | None) -> bool:
         """
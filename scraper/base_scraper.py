@@ -1,12 +1,30 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 import json
 from abc import ABC, abstractmethod
-import random
-from typing import List, Type, Any, Dict
-from bs4 import BeautifulSoup
-from seleniumbase import SB
+import os
+import threading
 import time
+from typing import List, Type, Any, Dict, Generator, Tuple, Callable, Iterable
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+import requests
+from urllib.parse import urlparse
 
 from helper.logger import setup_logger
+from helper.page_cache import PageCache
+from helper.rate_limiter import Pacer, RateLimiter, parse_retry_after
+from helper.session import get_session
+from helper.utils import (
+    dump_json,
+    extract_lists,
+    get_file_fingerprint,
+    get_file_sha256,
+    get_sb_configuration,
+    get_user_agent,
+    reuse_remote_browser,
+)
 from model.base_models import BaseConfig
 from model.sql_models import UploadedResource, ScraperOutput, ScraperFailure
 from service.analytics_manager import AnalyticsManager
@@ -15,21 +33,145 @@ from repository.scraper_failure_repository import ScraperFailureRepository
 from repository.scraper_output_repository import ScraperOutputRepository
 from repository.uploaded_resource_repository import UploadedResourceRepository
 
+# shared by all the scrapers of the process, so that server-rendered pages are fetched and parsed concurrently
+_REQUEST_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+# the subresources not needed to scrape the pages, blocked in the browser (see `BaseConfig.block_resources`); the
+# stylesheets are not blocked, since the visibility of the elements the scrapers wait for and click depends on them
+_BLOCKED_RESOURCES = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.bmp*", "*.svg*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*.mp4*", "*.webm*", "*.mp3*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+# the strainer of the scrapers which only need the links of the pages (see `_scrape_url`)
+LINKS_ONLY = SoupStrainer("a", href=True)
+
+
+@lru_cache(maxsize=1)
+def _get_done_scrapers() -> frozenset:
+    # the names of the scrapers with an output are queried once, without loading the outputs themselves; the cache is
+    # cleared whenever an output is stored
+    return frozenset(ScraperOutputRepository().get_distinct("scraper"))
+
+
+@lru_cache(maxsize=None)
+def _get_scroll_script(
+    read_more_selector: str | None,
+    read_more_text: str | None,
+    pause_ms: int,
+    max_scrolls: int,
+    max_height_px: int,
+    quiet_ms: int = 200,
+    idle_ms: int = 800,
+) -> str:
+    # the whole scrolling runs in the page, as a single promise awaited by the scraper: the scrollable element is looked
+    # up once, each step clicks the "read more" button (if any), measures the height and scrolls down, then waits until
+    # the DOM changed and stayed unchanged for a while, or did not change at all for a longer while (e.g., at the end of
+    # the page), or until the pause expires, until the height stops growing.
+    # Infinite feeds never stop growing, hence the scrolling is capped in steps and height: the promise resolves to true
+    # if a cap was hit. The script is built once per configuration, since it is the same for all the pages of a scraper
+    return f"""
+        (async () => {{
+            // the usual containers are checked before walking the whole DOM, each check forcing a layout
+            const isScrollable = e => e && e.scrollHeight > e.clientHeight;
+            const scrollable = [document.scrollingElement || document.documentElement]
+                .concat(['main', '[role=main]', '#content', '.scroll-container'].map(s => document.querySelector(s)))
+                .find(isScrollable)
+                || Array.from(document.querySelectorAll('*')).find(isScrollable)
+                || null;
+            const readMoreSelector = {json.dumps(read_more_selector)};
+            const readMoreText = {json.dumps(read_more_text)};
+
+            const step = () => {{
+                if (readMoreSelector) {{
+                    const button = Array.from(document.querySelectorAll(readMoreSelector)).find(
+                        e => e.offsetParent !== null && e.textContent.includes(readMoreText)
+                    );
+                    if (button) {{
+                        button.click();
+                    }}
+                }}
+                const height = scrollable ? scrollable.scrollHeight : document.body.scrollHeight;
+                if (scrollable) {{
+                    scrollable.scrollTop = height;
+                }} else {{
+                    window.scrollTo(0, height);
+                }}
+                return height;
+            }};
+
+            const settle = () => new Promise(resolve => {{
+                const start = Date.now();
+                let lastMutation = 0;
+                const observer = new MutationObserver(() => {{ lastMutation = Date.now(); }});
+                observer.observe(document.body, {{childList: true, subtree: true}});
+                const timer = setInterval(() => {{
+                    const now = Date.now();
+                    if (
+                        (lastMutation ? now - lastMutation >= {quiet_ms} : now - start >= {idle_ms})
+                        || now - start >= {pause_ms}
+                    ) {{
+                        clearInterval(timer);
+                        observer.disconnect();
+                        resolve();
+                    }}
+                }}, 50);
+            }});
+
+            let lastHeight = step();
+            for (let i = 0; i < {max_scrolls}; i++) {{
+                if (lastHeight > {max_height_px}) {{
+                    return true;
+                }}
+                await settle();
+                const height = step();
+                if (height === lastHeight) {{
+                    return false;
+                }}
+                lastHeight = height;
+            }}
+            return true;
+        }})()
+    """
+
 
 class BaseScraper(ABC):
     def __init__(self) -> None:
-        self._driver: SB = None
+        # the browser of each worker of `_map_with_browsers`, which replaces the browser of the scraper in its thread
+        self.__worker_browser = threading.local()
+        # while scraping, the browser is started at the first access to the driver, and closed by this stack at the end,
+        # so that the scrapers which only perform plain HTTP requests never start it
+        self.__browser_stack: ExitStack | None = None
+        self.__browser_lock = threading.Lock()
+
+        self._driver: Any = None
 
         self._cookie_handled = False
 
         self._config_model = None
         self._waited_tag = None
+        # whether the run was forced, i.e., the cached outcomes of the previous runs must be checked again
+        self._force = False
 
         self._logging_db_scraper = self.__class__.__name__
         self._logger = setup_logger(self.__class__.__name__)
 
         self._s3_client = S3Storage()
 
+        # the pooled session of the process, so that the plain HTTP requests reuse the keep-alive connections
+        self._session = get_session()
+        # one rate limiter per host, so that the requests to a throttling host do not slow down the others
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        # the pages fetched by plain HTTP requests are cached on disk, so that the re-runs do not fetch them again
+        self._page_cache = PageCache()
+        # the pages are opened in the browser with a pause in between, to avoid being blocked by the servers (see
+        # `BaseConfig.inter_request_delay`)
+        self._navigation_pacer = Pacer(0.1, 0.5)
+        # the resources downloaded from the remote sources are throttled by a token bucket per host, so that small
+        # batches are retrieved at once, while larger ones are spaced according to the configured rate, without the
+        # downloads from a host slowing down those from the others
+        self._download_rate_limiters: Dict[str, RateLimiter] = {}
+
         self._scraper_failure_repository = ScraperFailureRepository()
         self._scraper_output_repository = ScraperOutputRepository()
         self._uploaded_resource_repository = UploadedResourceRepository()
@@ -37,13 +179,12 @@ class BaseScraper(ABC):
         self._analytics_manager = AnalyticsManager()
 
     def __call__(self, force: bool = False):
-        from helper.utils import is_json_serializable
-
         if not self._config_model:
             self._logger.error("No configuration model set, aborting.")
             return
 
-        if not force and self._scraper_output_repository.get_one_by({"scraper": self._logging_db_scraper}):
+        self._force = force
+        if not force and self._logging_db_scraper in _get_done_scrapers():
             self._logger.warning(f"Scraper {self.__class__.__name__} already done")
             return
 
@@ -54,12 +195,15 @@ class BaseScraper(ABC):
             return
 
         links = self.post_process(scraping_results)
-        output = ScraperOutput(
-            scraper=self._logging_db_scraper,
-            output=json.dumps(scraping_results if is_json_serializable(scraping_results) else links)
-        )
+        # the results are serialized once: the links are stored instead only if the results are not serializable
+        try:
+            payload = dump_json(scraping_results)
+        except (TypeError, ValueError):
+            payload = dump_json(links)
+        output = ScraperOutput(scraper=self._logging_db_scraper, output=payload)
         self._scraper_output_repository.upsert(output, {"scraper": output.scraper}, {"output": output.output})
-        del output, scraping_results
+        _get_done_scrapers.cache_clear()
+        del output, payload, scraping_results
 
         self.upload_to_s3(links)
         del links
@@ -69,6 +213,8 @@ class BaseScraper(ABC):
 
     def set_config_model(self, config_model: BaseConfig):
         self._config_model = config_model
+        if isinstance(config_model, BaseConfig):
+            self._navigation_pacer = Pacer(*config_model.inter_request_delay)
         return self
 
     def set_config_model_from_dict(self, config_dict: Dict[str, Any]):
@@ -78,31 +224,94 @@ class BaseScraper(ABC):
         self._logging_db_scraper = scraper
         return self
 
-    def set_driver(self, driver: SB):
+    @property
+    def _driver(self) -> Any:
+        driver = getattr(self.__worker_browser, "driver", None) or self.__driver
+        if driver is None and self.__browser_stack is not None:
+            driver = self.__start_browser()
+        return driver
+
+    @_driver.setter
+    def _driver(self, driver: Any):
+        self.__driver = driver
+
+    @property
+    def _cookie_handled(self) -> bool:
+        return getattr(self.__worker_browser, "cookie_handled", self.__cookie_handled)
+
+    @_cookie_handled.setter
+    def _cookie_handled(self, cookie_handled: bool):
+        if hasattr(self.__worker_browser, "cookie_handled"):
+            self.__worker_browser.cookie_handled = cookie_handled
+        else:
+            self.__cookie_handled = cookie_handled
+
+    def set_driver(self, driver: Any):
         self._driver = driver
+        self.__block_resources()
         return self
 
-    def _run_scraping(self) -> Any | None:
-        from helper.utils import get_sb_configuration
+    def __block_resources(self):
+        # the browser may be shared with other scrapers, hence the blocked resources are reset when not blocked
+        import mycdp
+
+        block_resources = isinstance(self._config_model, BaseConfig) and self._config_model.block_resources
+        self._driver.cdp.loop.run_until_complete(self._driver.cdp.page.send(mycdp.network.enable()))
+        self._driver.cdp.loop.run_until_complete(self._driver.cdp.page.send(
+            mycdp.network.set_blocked_urls(urls=_BLOCKED_RESOURCES if block_resources else [])
+        ))
+
+    def __start_browser(self) -> Any:
+        from seleniumbase import SB
 
-        with SB(**get_sb_configuration()) as self._driver:
-            self._driver.activate_cdp_mode()
-            self._driver.cdp.maximize()
-            return self.scrape()
+        with self.__browser_lock:
+            if self.__driver is None:
+                driver = self.__browser_stack.enter_context(SB(**get_sb_configuration(self.__class__.__name__)))
+                driver.activate_cdp_mode()
+                driver.cdp.maximize()
+                self.__driver = driver
+                self.__block_resources()
+            return self.__driver
 
-    def _scrape_url(self, url: str, pause_time: int = 2) -> BeautifulSoup:
+    def _run_scraping(self) -> Any | None:
+        with ExitStack() as self.__browser_stack:
+            try:
+                return self.scrape()
+            finally:
+                self.__browser_stack = None
+                self.__driver = None
+
+    def _scrape_url(self, url: str, pause_time: int = 2, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
         """
         Scrape the URL using Selenium and BeautifulSoup.
 
         Args:
             url (str): url contains volume and issue number. Eg: https://www.mdpi.com/2072-4292/1/3
-            pause_time (int): time to pause between scrolls
+            pause_time (int): maximum time to wait for the content loaded by each scroll
+            parse_only (SoupStrainer | None): the tags to parse, if only some of them are needed, to skip the others
 
         Returns:
             BeautifulSoup: the fully rendered HTML of the URL.
         """
+        self._open_url(url, pause_time)
+
+        # Get the fully rendered HTML
+        return self._get_parsed_page_source(parse_only)
+
+    def _open_url(self, url: str, pause_time: int = 2):
+        """
+        Open the URL in the browser and scroll through it to load all its content, as `_scrape_url` does, but without
+        parsing the page: for the scrapers which then interact with the browser, rather than reading the page source.
+
+        Args:
+            url (str): the URL to open
+            pause_time (int): maximum time to wait for the content loaded by each scroll
+        """
+        self._navigation_pacer.wait()
         self._driver.cdp.open(url)
-        self._driver.cdp.sleep(random.uniform(1.5, 2.5))
+        # the page is usable as soon as its DOM is parsed, without waiting for all its images and scripts: the tags the
+        # scraper needs, if any, are waited for by `_wait_for_page_load`
+        self.__wait_for_script('["interactive", "complete"].includes(document.readyState)', 2.5)
         self._driver.uc_gui_click_captcha()
         self._wait_for_page_load()
         self._handle_cookie()
@@ -111,48 +320,295 @@ class BaseScraper(ABC):
         self._driver.cdp.click_if_visible("div.modal_content button.btn-close")
         self._driver.cdp.sleep(0.5)
 
-        # Scroll through the page to load all articles
-        last_height = self._driver.execute_script(f"""
-            function getScrollableElement() {{
-                const elements = document.querySelectorAll('*');
-                for (const element of elements) {{
-                    if (element.scrollHeight > element.clientHeight) {{
-                        return element;
-                    }}
-                }}
-                return null;
-            }}
-            const scrollable = getScrollableElement();
-            return scrollable ? scrollable.scrollHeight : document.body.scrollHeight;
-        """)
+        # Scroll through the page to load all articles, in a single round trip
+        read_more_button = self._config_model.read_more_button
+        capped = self._evaluate(
+            _get_scroll_script(
+                read_more_button.selector if read_more_button else None,
+                read_more_button.text if read_more_button else None,
+                int(pause_time * 1000),
+                self._config_model.max_scrolls,
+                self._config_model.max_height_px,
+            ),
+            await_promise=True,
+        )
+        if capped:
+            self._logger.warning(f"Scrolling of {url} stopped at the configured limits, the page may be incomplete")
 
-        while True:
-            # Scroll down to the bottom
-            self._driver.execute_script(f"""
-                if (scrollable) {{
-                    scrollable.scrollTop = scrollable.scrollHeight;
-                }} else {{
-                    window.scrollTo(0, document.body.scrollHeight);
-                }}
-            """)
-            self._driver.cdp.sleep(pause_time)
+        # Pause before the next request to avoid being blocked by the server, but only for the time not spent meanwhile
+        self._navigation_pacer.done()
+
+    def __wait_for_script(self, script: str, timeout: float, poll_interval: float = 0.1) -> bool:
+        """
+        Wait until the script evaluates to a truthy value in the page, or until the timeout expires. The script is
+        evaluated at once, and then polled.
+
+        Args:
+            script (str): the script to evaluate
+            timeout (float): the maximum time to wait, in seconds
+            poll_interval (float): the time between two checks, in seconds
+
+        Returns:
+            bool: True if the script returned a truthy value before the timeout, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        while not self._evaluate(script):
+            if time.monotonic() >= deadline:
+                return False
+            self._driver.cdp.sleep(poll_interval)
+        return True
+
+    def _evaluate(self, expression: str, await_promise: bool = False) -> Any:
+        """
+        Evaluate the JavaScript expression in the page, with a single `Runtime.evaluate` command sent over the DevTools
+        websocket of the browser. Unlike `execute_script`, the expression is sent as is (no `return` statement is
+        needed) and the promise it evaluates to, if any, can be awaited.
+
+        Args:
+            expression (str): the JavaScript expression
+            await_promise (bool): whether to wait for the promise the expression evaluates to, and return its value
+
+        Returns:
+            Any: the value of the expression, or None if it is falsy.
+        """
+        return self._driver.cdp.loop.run_until_complete(
+            self._driver.cdp.page.evaluate(expression, await_promise=await_promise)
+        )
+
+    def _request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        """
+        Send a plain HTTP request through the pooled session, paced by the rate limiter of the scraper. When the server
+        throttles the request (HTTP 429), the rate is decreased and the request is retried after the delay stated by the
+        `Retry-After` header.
 
-            if self._config_model.read_more_button:
-                self._driver.cdp.click_if_visible(
-                    f"{self._config_model.read_more_button.selector}:contains('{self._config_model.read_more_button.text}')"
+        Args:
+            method (str): the HTTP method
+            url (str): the URL to request
+            max_retries (int): the maximum number of retries of a throttled request
+            **kwargs: the keyword arguments of `requests.Session.request`
+
+        Returns:
+            requests.Response: the response, i.e., the last throttled one if the retries were exhausted.
+        """
+        rate_limiter = self._get_rate_limiter(url)
+        for attempt in range(max_retries + 1):
+            rate_limiter.acquire()
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                rate_limiter.on_success()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            rate_limiter.on_throttle(retry_after)
+            self._logger.warning(
+                f"Request to URL {url} throttled, retrying in {retry_after:.1f}s with {rate_limiter.rate:.1f} req/s"
+            )
+            if attempt < max_retries:
+                response.close()
+
+        return response
+
+    def _get_rate_limiter(self, url: str) -> RateLimiter:
+        """
+        Get the rate limiter of the host of the URL, creating it on first use.
+
+        Args:
+            url (str): the URL to request
+
+        Returns:
+            RateLimiter: the rate limiter of the host.
+        """
+        host = urlparse(url).netloc
+        with self._rate_limiters_lock:
+            if host not in self._rate_limiters:
+                self._rate_limiters[host] = RateLimiter()
+            return self._rate_limiters[host]
+
+    def _get_download_rate_limiter(self, url: str) -> RateLimiter:
+        """
+        Get the rate limiter of the downloads of the resources from the host of the URL, creating it on first use (see
+        `DOWNLOAD_RATE` and `DOWNLOAD_BURST`).
+
+        Args:
+            url (str): the URL of the resource
+
+        Returns:
+            RateLimiter: the download rate limiter of the host.
+        """
+        host = urlparse(url).netloc
+        with self._rate_limiters_lock:
+            if host not in self._download_rate_limiters:
+                self._download_rate_limiters[host] = RateLimiter(
+                    rate=float(os.getenv("DOWNLOAD_RATE", "0.5")), capacity=int(os.getenv("DOWNLOAD_BURST", "10"))
                 )
+            return self._download_rate_limiters[host]
 
-            # Calculate new scroll height and compare with the last height
-            new_height = self._driver.execute_script("return scrollable ? scrollable.scrollHeight : document.body.scrollHeight;")
-            if new_height == last_height:
-                break
-            last_height = new_height
+    def _scrape_url_by_request(self, url: str, timeout: int | None = 30) -> BeautifulSoup | None:
+        """
+        Scrape the URL with a plain HTTP request, without rendering it in the browser. Suitable for server-rendered
+        pages, where the browser round-trips are not needed.
 
-        # Sleep for some time to avoid being blocked by the server on the next request
-        self._driver.cdp.sleep(random.uniform(2, 5))
+        Args:
+            url (str): the URL to scrape
+            timeout (int): the timeout of the request, in seconds
 
-        # Get the fully rendered HTML
-        return self._get_parsed_page_source()
+        Returns:
+            BeautifulSoup | None: the HTML of the URL, or None if the request failed.
+        """
+        if cached := self._page_cache.get(url):
+            status_code, content = cached
+            if status_code != 200:
+                self._logger.warning(f"Failed to request URL {url}. Error: cached {status_code} response")
+                return None
+            return self._parse_html(content)
+
+        try:
+            response = self._request("GET", url, headers={"User-Agent": get_user_agent()}, timeout=timeout)
+            self._page_cache.set(url, response.status_code, response.content)
+            response.raise_for_status()
+        except Exception as e:
+            self._logger.warning(f"Failed to request URL {url}. Error: {e}")
+            return None
+
+        return self._parse_html(response.content)
+
+    def _scrape_urls_by_request(self, urls: List[str], timeout: int | None = 30) -> List[BeautifulSoup | None]:
+        """
+        Scrape several URLs with plain HTTP requests, fetching and parsing them concurrently in a thread pool.
+
+        Args:
+            urls (List[str]): the URLs to scrape
+            timeout (int): the timeout of each request, in seconds
+
+        Returns:
+            List[BeautifulSoup | None]: the HTML of each URL, in the same order of the URLs, or None if the request failed.
+        """
+        return self._map_concurrently(lambda url: self._scrape_url_by_request(url, timeout), urls)
+
+    def _map_concurrently(self, fnc: Callable[[Any], Any], items: Iterable) -> List:
+        """
+        Apply the function to each item concurrently, in the thread pool shared by the scrapers. Suitable for plain
+        HTTP requests only, since the browser driver cannot be used by several threads.
+
+        Args:
+            fnc (Callable[[Any], Any]): the function to apply
+            items (Iterable): the items to apply the function to
+
+        Returns:
+            List: the results of the function, in the same order of the items.
+        """
+        return list(_REQUEST_POOL.map(fnc, items))
+
+    def _map_with_browsers(self, fnc: Callable[[Any], Any], items: Iterable) -> List:
+        """
+        Apply the function, which scrapes with the browser, to each item. If `BROWSER_POOL_SIZE` is greater than 1, the
+        items are spread across as many workers, each of them driving its own browser (started at its first item and
+        closed at the end), since a browser cannot be used by several threads. Otherwise, the browser of the scraper is
+        used for all the items, one at a time.
+
+        Args:
+            fnc (Callable[[Any], Any]): the function to apply
+            items (Iterable): the items to apply the function to
+
+        Returns:
+            List: the results of the function, in the same order of the items.
+        """
+        pool_size = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+        if pool_size <= 1:
+            return list(map(fnc, items))
+
+        from seleniumbase import SB
+
+        browsers = []
+        browsers_lock = threading.Lock()
+
+        def apply_with_browser(item: Any) -> Any:
+            if getattr(self.__worker_browser, "driver", None) is None:
+                # the workers run at once, hence they cannot share the persisted browser profile
+                browser = SB(**get_sb_configuration())
+                with browsers_lock:
+                    browsers.append(browser)
+
+                driver = browser.__enter__()
+                driver.activate_cdp_mode()
+                driver.cdp.maximize()
+                self.__worker_browser.driver = driver
+                self.__worker_browser.cookie_handled = False
+                self.__block_resources()
+
+            return fnc(item)
+
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                return list(executor.map(apply_with_browser, items))
+        finally:
+            for browser in browsers:
+                browser.__exit__(None, None, None)
+
+    def _submit_concurrently(self, fnc: Callable[..., Any], *args) -> Future:
+        """
+        Submit the function to the thread pool shared by the scrapers, as `_map_concurrently` does, but for a single call
+        whose result is collected later.
+
+        Args:
+            fnc (Callable[..., Any]): the function to call
+            *args: the arguments of the function
+
+        Returns:
+            Future: the pending result of the function.
+        """
+        return _REQUEST_POOL.submit(fnc, *args)
+
+    def _iter_elements_by_request(
+        self, url: str, tags: Tuple[str, ...], timeout: int | None = 30
+    ) -> Generator[etree._Element, None, None]:
+        """
+        Stream the URL with a plain HTTP request and parse it incrementally, yielding the elements with the requested
+        tag names as soon as they are closed. Each element is cleared once the caller moves on, so the whole tree is
+        never materialized, and the download stops as soon as the caller stops iterating. The pages entirely read are
+        cached, and parsed from the cache by the next runs.
+
+        Args:
+            url (str): the URL to scrape
+            tags (Tuple[str, ...]): the names of the tags to yield
+            timeout (int): the timeout of the request, in seconds
+
+        Returns:
+            Generator[etree._Element, None, None]: the closed elements with the requested tag names.
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag=tags)
+        if cached := self._page_cache.get(url):
+            status_code, content = cached
+            if status_code != 200:
+                response = requests.Response()
+                response.status_code, response.url = status_code, url
+                raise requests.HTTPError(f"Cached {status_code} response for url: {url}", response=response)
+            chunks = [content]
+        else:
+            chunks = self.__iter_response_chunks(url, get_user_agent(), timeout)
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                yield element
+                element.clear()
+
+        parser.close()
+        for _, element in parser.read_events():
+            yield element
+
+    def __iter_response_chunks(self, url: str, user_agent: str, timeout: int) -> Generator[bytes, None, None]:
+        with self._request("GET", url, headers={"User-Agent": user_agent}, timeout=timeout, stream=True) as response:
+            if response.status_code == 404:
+                self._page_cache.set(url, response.status_code, b"")
+            response.raise_for_status()
+
+            chunks = []
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                chunks.append(chunk)
+                yield chunk
+
+            self._page_cache.set(url, response.status_code, b"".join(chunks))
 
     def _wait_for_page_load(self, timeout: int | None = 30):
         if self._config_model.loading_tag:
@@ -169,14 +625,49 @@ class BaseScraper(ABC):
             except:
                 pass
 
-    def _get_parsed_page_source(self) -> BeautifulSoup:
+    def _get_parsed_page_source(self, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
         """
         Get the page source parsed by BeautifulSoup.
 
+        Args:
+            parse_only (SoupStrainer | None): The tags to parse, if only some of them are needed.
+
         Returns:
             BeautifulSoup: The parsed page source.
         """
-        return BeautifulSoup(self._driver.cdp.get_page_source(), "html.parser")
+        return self._parse_html(self._driver.cdp.get_page_source(), parse_only)
+
+    def _extract_attrs(self, selector: str, attr: str) -> List[str]:
+        """
+        Get the values of an attribute of the elements matching the CSS selector, queried in the page itself: when the
+        scraper only needs a few values of the page, such as the links, neither the page source is transferred from the
+        browser nor it is parsed.
+
+        Args:
+            selector (str): The CSS selector of the elements.
+            attr (str): The name of the attribute.
+
+        Returns:
+            List[str]: The values of the attribute, in document order, for the elements having it.
+        """
+        return self._evaluate(
+            f"Array.from(document.querySelectorAll({json.dumps(selector)}), e => e.getAttribute({json.dumps(attr)}))"
+            ".filter(value => value !== null)"
+        ) or []
+
+    def _parse_html(self, markup: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+        """
+        Parse the HTML with the lxml parser. When only some tags are needed (e.g., the links), the tree is built for
+        them only.
+
+        Args:
+            markup (str): The HTML to parse.
+            parse_only (SoupStrainer | None): The tags to parse, if only some of them are needed.
+
+        Returns:
+            BeautifulSoup: The parsed HTML.
+        """
+        return BeautifulSoup(markup, "lxml", parse_only=parse_only)
 
     def _save_failure(self, source: str, message: str | None = None):
         message = message or "No source link found."
@@ -190,27 +681,82 @@ class BaseScraper(ABC):
 
     def upload_to_s3(self, sources_links: Dict[str, List[str]] | List[str]):
         """
-        Upload the source files to S3.
+        Upload the source files to S3. When the files are retrieved by plain HTTP requests, several of them are
+        retrieved and uploaded concurrently (see `UPLOAD_CONCURRENCY`), while the download rate limiter of each host
+        keeps the pace polite to its server. Otherwise, the files are rendered one at a time, in a single browser.
 
         Args:
             sources_links (Dict[str, List[str]] | List[str]): The list of links of the various sources.
         """
         self._logger.debug("Uploading files to S3")
 
-        for link in sources_links:
-            if self._uploaded_resource_repository.get_one_by(
-                {"scraper": self._logging_db_scraper, "source": link, "success": True}
-            ):
+        # the resources already uploaded by the previous runs are fetched with a single query, and the duplicated links
+        # are uploaded once
+        uploaded_links = set(self._uploaded_resource_repository.get_distinct(
+            "source", {"scraper": self._logging_db_scraper, "success": True}
+        ))
+
+        def upload_link(link: str):
+            if link in uploaded_links:
                 self._logger.warning(f"Resource {link} was already successfully uploaded, skipping.")
-                continue
+                return
 
+            # wait for the rate limiter before retrieving the resource, to avoid overwhelming the server
+            self._get_download_rate_limiter(link).acquire()
             current_resource = self._uploaded_resource_repository.get_by_url(
                 self._logging_db_scraper, link, self._config_model
             )
-            self._upload_resource_to_s3(current_resource, link)
+            try:
+                self._upload_resource_to_s3(current_resource, link)
+            finally:
+                # the file downloaded by request is a temporary one
+                if current_resource.content_path:
+                    os.remove(current_resource.content_path)
+
+        links = dict.fromkeys(sources_links)
+        max_workers = int(os.getenv("UPLOAD_CONCURRENCY", "4")) if self._config_model.files_by_request else 1
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(upload_link, links))
+        else:
+            # the files rendered in the browser share a single one, instead of starting a browser for each file
+            with reuse_remote_browser():
+                for link in links:
+                    upload_link(link)
 
-            # Sleep after each successful upload to avoid overwhelming the server
-            time.sleep(random.uniform(2, 5))
+    def _upload_files_to_s3(self, file_paths: List[str], folder: str):
+        """
+        Upload local files to S3 concurrently. No pause is needed between the uploads, since the files are not
+        retrieved from the remote sources anymore.
+
+        Args:
+            file_paths (List[str]): The paths of the files to upload.
+            folder (str): The folder containing the files, stripped from the paths to name the resources.
+        """
+        # the SHA-256 of the files uploaded in this run, by fingerprint, so that duplicated files are skipped without
+        # hashing them entirely (unless their fingerprints collide) and without querying the database
+        uploaded_sha256 = {}
+        lock = threading.Lock()
+
+        def upload_file(file_path: str):
+            fingerprint = get_file_fingerprint(file_path)
+            with lock:
+                known_sha256 = uploaded_sha256.get(fingerprint)
+            if known_sha256 and get_file_sha256(file_path) == known_sha256:
+                self._logger.warning(f"Resource {file_path} duplicates an already uploaded file, skipping.")
+                return
+
+            current_resource = self._uploaded_resource_repository.get_by_content(
+                self._logging_db_scraper, self._config_model.bucket_key, file_path
+            )
+            self._upload_resource_to_s3(current_resource, file_path.replace(folder, ""))
+
+            if current_resource.success and current_resource.sha256:
+                with lock:
+                    uploaded_sha256[fingerprint] = current_resource.sha256
+
+        with ThreadPoolExecutor(max_workers=int(os.getenv("S3_UPLOAD_WORKERS", "8"))) as executor:
+            list(executor.map(upload_file, file_paths))
 
     def raw_upload_to_s3(self, sources_links: List[str]):
         self.upload_to_s3(sources_links)
@@ -220,19 +766,20 @@ class BaseScraper(ABC):
             self._logger.warning(f"Resource {resource_name} was already successfully uploaded, skipping.")
             return None
 
-        if resource.content:
+        if resource.content or resource.content_path:
             resource.success = self._s3_client.upload_content(resource)
         else:
             self._logger.warning(f"We were unable to retrieve the content from {resource_name}, skipping upload.")
         return self._uploaded_resource_repository.upsert(
-            resource, {"scraper": resource.scraper, "source": resource.source}, keys_to_purge=["content"]
+            resource,
+            {"scraper": resource.scraper, "source": resource.source},
+            keys_to_purge=["content", "content_path"],
         )
 
     def resume_uploads(self):
         """
         Resume the uploads of the resources that failed to upload.
         """
-        from helper.utils import extract_lists
         from scraper.base_mapped_publisher_scraper import BaseMappedPublisherScraper
 
         output = self._scraper_output_repository.get_one_by({"scraper": self._logging_db_scraper})
@@ -250,7 +797,6 @@ class BaseScraper(ABC):
         """
         Resume the scraping of the resources that failed to scrape.
         """
-        from helper.utils import get_sb_configuration
         from scraper.base_mapped_publisher_scraper import BaseMappedPublisherScraper
 
         self._logger.info(f"Resuming scraper {self.__class__.__name__}")
@@ -261,14 +807,15 @@ class BaseScraper(ABC):
             return
 
         self._scraper_failure_repository.delete_by({"scraper": self._logging_db_scraper})
-        with SB(**get_sb_configuration()) as self._driver:
-            self._driver.activate_cdp_mode()
-            self._driver.cdp.maximize()
-
-            scraped = []
-            for failure in failures:
-                self._logger.info(f"Resuming scraping of {failure.source}")
-                scraped.extend([failure.source] if ".pdf" in failure.source else self.scrape_failure(failure))
+        scraped = []
+        with ExitStack() as self.__browser_stack:
+            try:
+                for failure in failures:
+                    self._logger.info(f"Resuming scraping of {failure.source}")
+                    scraped.extend([failure.source] if ".pdf" in failure.source else self.scrape_failure(failure))
+            finally:
+                self.__browser_stack = None
+                self.__driver = None
 
         self._logger.debug(f"Number of sources found: {len(scraped)}")
 
@@ -276,7 +823,7 @@ class BaseScraper(ABC):
         scraping_results = current_output.output_json if current_output else {}
         scraping_results["Resumed"] = scraped
 
-        output = ScraperOutput(scraper=self._logging_db_scraper, output=json.dumps(scraping_results))
+        output = ScraperOutput(scraper=self._logging_db_scraper, output=dump_json(scraping_results))
         self._scraper_output_repository.upsert(output, {"scraper": output.scraper}, {"output": output.output})
         del current_output, output, scraping_results
 
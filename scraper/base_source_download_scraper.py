@@ -1,9 +1,7 @@
 import os
-import random
 import time
 from abc import ABC, abstractmethod
 from typing import List
-from seleniumbase import SB
 
 from helper.utils import get_sb_configuration
 from scraper.base_scraper import BaseScraper
@@ -11,18 +9,22 @@ from scraper.base_scraper import BaseScraper
 
 class BaseSourceDownloadScraper(BaseScraper, ABC):
     def upload_to_s3(self, sources_links: List[str]):
+        from seleniumbase import SB
+
         self._logger.debug("Uploading files to S3")
 
-        sb_configuration = get_sb_configuration()
+        sb_configuration = get_sb_configuration(self.__class__.__name__)
         sb_configuration["external_pdf"] = True
 
         with SB(**sb_configuration) as driver:
+            driver.activate_cdp_mode()
+            driver.cdp.maximize()
             self.set_driver(driver)
-            self._driver.activate_cdp_mode()
-            self._driver.cdp.maximize()
 
             for link in sources_links:
                 self._logger.debug(f"Downloading file from {link}")
+                # wait for the rate limiter before downloading the file, to avoid overwhelming the server
+                self._get_download_rate_limiter(link).acquire()
                 if not (file_path := self._get_file_path_from_link(link)):
                     continue
 
@@ -31,9 +33,8 @@ class BaseSourceDownloadScraper(BaseScraper, ABC):
                 )
                 self._upload_resource_to_s3(current_resource, os.path.basename(file_path))
 
-                # remove the file and sleep after each successful upload to avoid overwhelming the server
+                # remove the file after each successful upload
                 os.remove(file_path)
-                time.sleep(random.uniform(2, 5))
 
     def _wait_end_download(
         self, file_identifier: str, timeout: int | None = 30, interval: float | None = 0.5
@@ -53,17 +54,15 @@ class BaseSourceDownloadScraper(BaseScraper, ABC):
         # wait until the download is completed
         while time.time() - start_time < timeout:
             time.sleep(interval)
-            completed_downloads = sorted(
-                [f for f in os.listdir(download_folder_path) if file_identifier in f and ".crdownload" not in f],
-                key=lambda x: os.path.getmtime(os.path.join(download_folder_path, x)),
-                reverse=True
-            )
+            with os.scandir(download_folder_path) as entries:
+                completed_downloads = [
+                    entry for entry in entries if file_identifier in entry.name and ".crdownload" not in entry.name
+                ]
             if not completed_downloads:
                 continue
 
             # move the downloaded file to the download folder
-            file = completed_downloads[0]
-            return os.path.join(download_folder_path, file)
+            return max(completed_downloads, key=lambda entry: entry.stat().st_mtime).path
 
         return None
 
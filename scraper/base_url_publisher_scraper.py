@@ -17,15 +17,8 @@ class BaseUrlPublisherScraper(BaseScraper):
             ResultSet | List[Tag]: A ResultSet (i.e., a list) or a list of Tag objects containing the tags to the PDF links. If no tag was found, return None.
         """
         pdf_tags = []
-        for source in self._config_model.sources:
-            if source.type == SourceType.JOURNAL:
-                scraped_tags = self._scrape_journal(source)
-            elif source.type == SourceType.ISSUE_OR_COLLECTION:
-                scraped_tags = self._scrape_issue_or_collection(source)
-            else:
-                scraped_tag = self._scrape_article(source)
-                scraped_tags = [scraped_tag] if scraped_tag is not None else None
-
+        sources = self._config_model.sources
+        for source, scraped_tags in zip(sources, self._map_with_browsers(self.__scrape_source, sources)):
             if scraped_tags is not None:
                 pdf_tags.extend(scraped_tags)
             else:
@@ -33,6 +26,15 @@ class BaseUrlPublisherScraper(BaseScraper):
 
         return pdf_tags if pdf_tags else None
 
+    def __scrape_source(self, source: BaseUrlPublisherSource) -> ResultSet | List[Tag] | None:
+        if source.type == SourceType.JOURNAL:
+            return self._scrape_journal(source)
+        if source.type == SourceType.ISSUE_OR_COLLECTION:
+            return self._scrape_issue_or_collection(source)
+
+        scraped_tag = self._scrape_article(source)
+        return [scraped_tag] if scraped_tag is not None else None
+
     def scrape_failure(self, failure: ScraperFailure) -> List[str]:
         link = failure.source
         self._logger.info(f"Scraping URL: {link}")
@@ -77,7 +79,7 @@ class BaseUrlPublisherScraper(BaseScraper):
         Returns:
             List[str]: A list of strings containing the PDF links
         """
-        return list(set([get_scraped_url_by_bs_tag(tag, self._config_model.base_url) for tag in scrape_output]))
+        return list(dict.fromkeys(get_scraped_url_by_bs_tag(tag, self._config_model.base_url) for tag in scrape_output))
 
     @abstractmethod
     def _scrape_journal(self, source: BaseUrlPublisherSource) -> ResultSet | List[Tag] | None:
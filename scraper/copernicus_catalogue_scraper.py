@@ -1,7 +1,5 @@
 import os
-import random
 import shutil
-import time
 from typing import Type, List
 from uuid import uuid4
 from bs4 import Tag
@@ -34,7 +32,7 @@ class CopernicusCatalogueScraper(BasePaginationPublisherScraper):
 
     def _scrape_page(self, url: str) -> List[Tag] | None:
         try:
-            self._scrape_url(url)
+            self._open_url(url)
             if not (article_tags := self._driver.cdp.find_elements("div.service-catalogue-item a", timeout=0.5)):
                 self._save_failure(url)
 
@@ -92,23 +90,13 @@ class CopernicusCatalogueScraper(BasePaginationPublisherScraper):
         self._logger.debug("Uploading files to S3")
         download_folder = self.download_folder_path
 
-        file_paths = [
-            os.path.join(download_folder, file)
-            for file in os.listdir(download_folder)
-            if os.path.isfile(os.path.join(download_folder, file))
-        ]
+        with os.scandir(download_folder) as entries:
+            file_paths = [entry.path for entry in entries if entry.is_file()]
         if not file_paths:
             for source_link in sources_links:
                 self._save_failure(source_link, f"No files found in the downloading folder: {source_link}")
 
-        for file_path in file_paths:
-            current_resource = self._uploaded_resource_repository.get_by_content(
-                self._logging_db_scraper, self._config_model.bucket_key, file_path
-            )
-            self._upload_resource_to_s3(current_resource, file_path.replace(download_folder, ""))
-
-            # Sleep after each successful upload to avoid overwhelming the server
-            time.sleep(random.uniform(2, 5))
+        self._upload_files_to_s3(file_paths, download_folder)
 
         shutil.rmtree(self.download_folder_path)
 
@@ -1,6 +1,7 @@
-import os
-from typing import Type, List
+import re
+from typing import Type, List, Dict
 from urllib.parse import urlparse
+from bs4 import BeautifulSoup, Tag
 
 from helper.utils import get_scraped_url_by_bs_tag
 from model.base_iterative_publisher_models import (
@@ -11,6 +12,10 @@ from model.base_iterative_publisher_models import (
 from model.sql_models import ScraperFailure
 from scraper.base_iterative_publisher_scraper import BaseIterativeWithConstraintPublisherScraper
 
+_ISSUE_URL_RE = re.compile(r"/articles/([^/]+)/issue([^/]+)\.html")
+# e.g., https://amt.copernicus.org/articles/17/1234/2024/, whose PDF is .../17/1234/2024/amt-17-1234-2024.pdf
+_ARTICLE_URL_RE = re.compile(r"^https?://([a-z0-9-]+)\.copernicus\.org/articles/(\d+)/(\d+)/(\d{4})/?$")
+
 
 class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
     @property
@@ -20,10 +25,15 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
     def journal_identifier(self, model: BaseIterativeWithConstraintPublisherJournal) -> str:
         return model.name
 
+    def _get_issue_url(
+        self, journal: BaseIterativeWithConstraintPublisherJournal, volume_num: int, issue_num: int
+    ) -> str:
+        return f"{journal.url.rstrip('/')}/articles/{volume_num}/issue{issue_num}.html"
+
     def _scrape_issue(
         self, journal: BaseIterativeWithConstraintPublisherJournal, volume_num: int, issue_num: int
     ) -> IterativePublisherScrapeIssueOutput | None:
-        issue_url = os.path.join(journal.url, "articles", str(volume_num), f"issue{issue_num}.html")
+        issue_url = self._get_issue_url(journal, volume_num, issue_num)
         self._logger.info(f"Processing Issue URL: {issue_url}")
         return self.__scrape_issue(issue_url)
 
@@ -40,9 +50,7 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
         parsed_url = urlparse(issue_url)
         journal_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
-        path = parsed_url.path.lstrip("/")
-        _, volume_num, issue_num = path.split("/")
-        issue_num = issue_num.replace("issue", "").replace(".html", "")
+        volume_num, issue_num = match.groups() if (match := _ISSUE_URL_RE.search(parsed_url.path)) else ("", "")
 
         try:
             scraper = self._scrape_url(issue_url)
@@ -51,13 +59,7 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
             # True, it will be included in the list)
             tags = scraper.find_all("a", class_="article-title", href=lambda href: href and "/articles/" in href)
 
-            pdf_links = [
-                pdf_link
-                for pdf_link in map(
-                    lambda tag: self._scrape_article(get_scraped_url_by_bs_tag(tag, journal_url)), tags
-                )
-                if pdf_link
-            ]
+            pdf_links = self._get_article_links([get_scraped_url_by_bs_tag(tag, journal_url) for tag in tags])
 
             self._logger.debug(f"PDF links found: {len(pdf_links)}")
             return pdf_links
@@ -66,9 +68,28 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
             return None
 
     def _scrape_article(self, article_url: str) -> str | None:
+        if pdf_link := self.__get_pdf_link_by_pattern(article_url):
+            return pdf_link
+
         self._logger.info(f"Processing Article URL: {article_url}")
         return self.__scrape_article(article_url)
 
+    def _scrape_articles(self, article_urls: List[str]) -> Dict[str, str | None]:
+        # the PDF links of the articles with a canonical URL are built without fetching the article pages at all
+        pdf_links = {article_url: self.__get_pdf_link_by_pattern(article_url) for article_url in article_urls}
+        article_urls = [article_url for article_url, pdf_link in pdf_links.items() if not pdf_link]
+
+        # the article pages are server-rendered, hence fetch and parse them concurrently with plain HTTP requests, and
+        # fall back to the browser only for the articles where the PDF link was not found
+        for article_url, scraper in zip(article_urls, self._scrape_urls_by_request(article_urls)):
+            if scraper and (pdf_tag := self.__find_pdf_tag(scraper)):
+                pdf_links[article_url] = get_scraped_url_by_bs_tag(pdf_tag, self.__get_base_url(article_url))
+                continue
+
+            pdf_links[article_url] = self._scrape_article(article_url)
+
+        return pdf_links
+
     def __scrape_article(self, article_url: str) -> str | None:
         """
         Scrape a single article.
@@ -79,15 +100,11 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
         Returns:
             str | None: The string containing the PDF link.
         """
-        parsed_url = urlparse(article_url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
         try:
             scraper = self._scrape_url(article_url)
 
-            # Find all PDF links using appropriate class or tag (if lambda returns True, it will be included in the list)
-            if pdf_tag := scraper.find("a", href=lambda href: href and ".pdf" in href):
-                return get_scraped_url_by_bs_tag(pdf_tag, base_url)
+            if pdf_tag := self.__find_pdf_tag(scraper):
+                return get_scraped_url_by_bs_tag(pdf_tag, self.__get_base_url(article_url))
 
             self._save_failure(article_url)
             return None
@@ -95,6 +112,29 @@ class CopernicusScraper(BaseIterativeWithConstraintPublisherScraper):
             self._log_and_save_failure(article_url, f"Failed to process Article {article_url}. Error: {e}")
             return None
 
+    def __get_pdf_link_by_pattern(self, article_url: str) -> str | None:
+        """
+        Build the PDF link of an article from its URL, when the URL has the canonical Copernicus shape.
+
+        Args:
+            article_url (str): The article URL.
+
+        Returns:
+            str | None: The string containing the PDF link, or None if the URL has an unknown shape.
+        """
+        if not (match := _ARTICLE_URL_RE.match(article_url)):
+            return None
+
+        return f"{article_url.rstrip('/')}/{'-'.join(match.groups())}.pdf"
+
+    def __find_pdf_tag(self, scraper: BeautifulSoup) -> Tag | None:
+        # Find the PDF link using appropriate class or tag (if lambda returns True, it will be included in the list)
+        return scraper.find("a", href=lambda href: href and ".pdf" in href)
+
+    def __get_base_url(self, url: str) -> str:
+        parsed_url = urlparse(url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
     def scrape_failure(self, failure: ScraperFailure) -> List[str]:
         link = failure.source
         self._logger.info(f"Scraping URL: {link}")
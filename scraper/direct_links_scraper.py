@@ -13,10 +13,18 @@ class DirectLinksScraper(BaseMappedPublisherScraper):
         if isinstance(sources_links, list):
             return super(BaseMappedPublisherScraper, self).upload_to_s3(sources_links)
 
+        # the validated config model is shared with the adapter: only the fields overridden by each source are swapped
+        # and restored, instead of copying the whole model for each source
+        bucket_key, files_by_request = self._config_model.bucket_key, self._config_model.files_by_request
         for source_name, source_links in sources_links.items():
-            current_config_model = self._config_model.model_copy()
+            if source_name in self._uploaded_sources:
+                self._logger.info(f"Files of source {source_name} already uploaded while scraping, skipping.")
+                continue
+
             self._config_model.bucket_key = self._bucket_keys[source_name]
             self._config_model.files_by_request = self._files_by_request[source_name]
 
-            super(BaseMappedPublisherScraper, self).upload_to_s3(source_links)
-            self.set_config_model(current_config_model)
+            try:
+                super(BaseMappedPublisherScraper, self).upload_to_s3(source_links)
+            finally:
+                self._config_model.bucket_key, self._config_model.files_by_request = bucket_key, files_by_request
@@ -1,4 +1,5 @@
 from typing import Type, List
+import soupsieve
 
 from helper.utils import get_scraped_url_by_bs_tag
 from model.elsevier_models import (
@@ -11,6 +12,8 @@ from model.elsevier_models import (
 from model.sql_models import ScraperFailure
 from scraper.base_source_download_scraper import BaseSourceDownloadScraper
 
+_PDF_DOWNLOAD_SELECTOR = soupsieve.compile('a[class*="pdf-download"][href*=".pdf"]')
+
 
 class ElsevierScraper(BaseSourceDownloadScraper):
     def __init__(self):
@@ -125,11 +128,7 @@ class ElsevierScraper(BaseSourceDownloadScraper):
             ) if next_issue_tag.get("href") else None
 
             # check for the presence of tags "a", class "pdf-download" with attribute `href` containing ".pdf"
-            pdf_tags = scraper.find_all(
-                "a",
-                class_=lambda class_: class_ and "pdf-download" in class_,
-                href=lambda href: href and ".pdf" in href
-            )
+            pdf_tags = _PDF_DOWNLOAD_SELECTOR.select(scraper)
             # if no PDF tag exists, try with the next issue since no PDF can be downloaded from the current one
             if not pdf_tags:
                 self._save_failure(source.url)
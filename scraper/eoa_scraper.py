@@ -1,5 +1,3 @@
-import random
-import time
 from typing import Type, List
 
 from helper.utils import parse_google_drive_link, get_scraped_url_by_web_element
@@ -28,7 +26,7 @@ class EOAScraper(BaseScraper):
 
     def __scrape_url(self, url: str) -> List[str]:
         try:
-            self._scrape_url(url)
+            self._open_url(url)
 
             # with Selenium, look for all "a" tags with "drive.google.com" in "href" and containing the "low" within the lowercased text
             tags = self._driver.cdp.find_elements(
@@ -55,7 +53,4 @@ class EOAScraper(BaseScraper):
             except Exception as e:
                 self._logger.error(f"Error while parsing Google Drive link {link}: {e}")
 
-            # Sleep after each successful upload to avoid overwhelming the server
-            time.sleep(random.uniform(2, 5))
-
         super().upload_to_s3(download_urls)
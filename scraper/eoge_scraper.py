@@ -15,7 +15,7 @@ class EOGEScraper(BaseUrlPublisherScraper):
         self._logger.info(f"Processing Journal {source.url}")
 
         try:
-            self._scrape_url(source.url)
+            self._open_url(source.url)
 
             # Click all the volume links to load all the issues
             buttons = self._driver.cdp.find_elements('a[data-toggle="collapse"]:not(.collapsed)', timeout=0.5)
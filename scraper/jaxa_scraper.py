@@ -3,6 +3,7 @@ from bs4 import ResultSet, Tag
 
 from model.base_url_publisher_models import BaseUrlPublisherSource, BaseUrlPublisherConfig
 from scraper.base_url_publisher_scraper import BaseUrlPublisherScraper
+from scraper.base_scraper import LINKS_ONLY
 
 
 class JAXAScraper(BaseUrlPublisherScraper):
@@ -17,7 +18,7 @@ class JAXAScraper(BaseUrlPublisherScraper):
         self._logger.info(f"Processing Issue / Collection {source.url}")
 
         try:
-            scraper = self._scrape_url(source.url)
+            scraper = self._scrape_url(source.url, parse_only=LINKS_ONLY)
 
             # Find all PDF links using appropriate class or tag (if lambda returns True, it will be included in the list)
             if not (html_tag_list := scraper.find_all("a", href=True, class_="btn--outline")):
@@ -1,4 +1,4 @@
-import os
+import re
 from typing import Type, Dict, List
 from bs4 import Tag
 
@@ -13,6 +13,8 @@ from scraper.base_mapped_publisher_scraper import BaseMappedPublisherScraper
 from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScraper
 from scraper.base_scraper import BaseMappedSubScraper
 
+_ISSUE_URL_RE = re.compile(r"([^/]+)/([^/]+)/?$")
+
 
 class MDPIScraper(BaseMappedPublisherScraper):
     @property
@@ -31,10 +33,13 @@ class MDPIJournalsScraper(BaseIterativePublisherScraper, BaseMappedSubScraper):
     def journal_identifier(self, model: MDPIJournal) -> str:
         return model.name
 
+    def _get_issue_url(self, journal: MDPIJournal, volume_num: int, issue_num: int) -> str:
+        return f"{journal.url.rstrip('/')}/{volume_num}/{issue_num}"
+
     def _scrape_issue(
         self, journal: MDPIJournal, volume_num: int, issue_num: int
     ) -> IterativePublisherScrapeIssueOutput | None:
-        issue_url = os.path.join(journal.url, str(volume_num), str(issue_num))
+        issue_url = self._get_issue_url(journal, volume_num, issue_num)
         self._logger.info(f"Processing Issue URL: {issue_url}")
 
         return self.__scrape_url(issue_url)
@@ -55,8 +60,7 @@ class MDPIJournalsScraper(BaseIterativePublisherScraper, BaseMappedSubScraper):
         Returns:
             BaseIterativePublisherScrapeIssueOutput | None: A list of PDF links found in the issue, or None if something went wrong.
         """
-        path, issue_num = os.path.split(url)
-        _, volume_num = os.path.split(path)
+        volume_num, issue_num = match.groups() if (match := _ISSUE_URL_RE.search(url)) else ("", "")
 
         try:
             scraper = self._scrape_url(url)
@@ -119,11 +123,11 @@ class MDPIGoogleSearchScraper(BasePaginationPublisherScraper, BaseMappedSubScrap
             # first of all, scrape the Google Search URL
             scraper = self._scrape_url(url)
 
+            base_url = self._config_model.base_url
+            forbidden_keywords = self.__forbidden_keywords
             mdpi_tags = scraper.find_all(
                 "a",
-                href=lambda href: href and self._config_model.base_url in href and not any(
-                    x in href for x in self.__forbidden_keywords
-                ),
+                href=lambda href: href and base_url in href and not any(x in href for x in forbidden_keywords),
             )
 
             if not (pdf_tag_list := [tag for mdpi_tag in mdpi_tags for tag in get_pdf_tags(mdpi_tag)]):
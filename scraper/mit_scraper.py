@@ -5,6 +5,8 @@ from helper.utils import get_scraped_url_by_bs_tag
 from model.base_url_publisher_models import BaseUrlPublisherSource, BaseUrlPublisherConfig
 from scraper.base_url_publisher_scraper import BaseUrlPublisherScraper
 
+_PDF_LINK_SELECTOR = 'a.download-file[href*=".pdf"]'
+
 
 class MITScraper(BaseUrlPublisherScraper):
     @property
@@ -24,10 +26,8 @@ class MITScraper(BaseUrlPublisherScraper):
             for tag in scraper.find_all("a", href=lambda href: href and "/courses/" in href and "/resources/earthsurface_" in href):
                 self._driver.cdp.open(get_scraped_url_by_bs_tag(tag, self._config_model.base_url))
                 self._driver.cdp.sleep(1)
-                if pdf_tag := self._get_parsed_page_source().find(
-                        "a", href=lambda href: href and ".pdf" in href, class_="download-file"
-                ):
-                    pdf_tag_list.append(pdf_tag)
+                if pdf_hrefs := self._extract_attrs(_PDF_LINK_SELECTOR, "href"):
+                    pdf_tag_list.append(Tag(name="a", attrs={"href": pdf_hrefs[0]}))
 
             if not pdf_tag_list:
                 self._save_failure(source.url)
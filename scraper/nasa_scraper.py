@@ -1,4 +1,3 @@
-import random
 from typing import List, Type, Dict
 from bs4 import Tag, ResultSet
 
@@ -14,6 +13,21 @@ from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScr
 from scraper.base_scraper import BaseMappedSubScraper, BaseScraper
 from scraper.base_url_publisher_scraper import BaseUrlPublisherScraper
 
+# resolves once the first PDF link of the page changed, i.e., the next page of results was rendered, or after 5 seconds
+_NEXT_PAGE_LOADED_SCRIPT = """
+    new Promise(resolve => {
+        const firstLink = () => (document.querySelector('a[href*=".pdf"]') || {}).href;
+        const previous = firstLink();
+        const start = Date.now();
+        const timer = setInterval(() => {
+            if (firstLink() !== previous || Date.now() - start >= 5000) {
+                clearInterval(timer);
+                resolve();
+            }
+        }, 100);
+    })
+"""
+
 
 class NASAScraper(BaseMappedPublisherScraper):
     @property
@@ -40,12 +54,13 @@ class NASAEarthDataWikiScraper(BaseUrlPublisherScraper, BaseMappedSubScraper):
         self._logger.info(f"Processing Issue / Collection {source.url}")
 
         try:
-            self._scrape_url(source.url)
+            self._open_url(source.url)
 
+            # each round expands the collapsed toggles in the page, as a single awaited script
             all_expanded = False
             while not all_expanded:
-                all_expanded = self._driver.execute_script("""
-                    let expandAll = async () => {
+                all_expanded = self._evaluate("""
+                    (async () => {
                         let toggles = document.querySelectorAll("a.aui-iconfont-chevron-right");
                         if (toggles.length == 0) {
                             return true;
@@ -55,9 +70,8 @@ class NASAEarthDataWikiScraper(BaseUrlPublisherScraper, BaseMappedSubScraper):
                             await new Promise(resolve => setTimeout(resolve, 1000));
                         }
                         return false;
-                    }
-                    return await expandAll();
-                """)
+                    })()
+                """, await_promise=True)
 
             if not (html_tag_list := self._get_parsed_page_source().find_all(
                 "a", href=lambda href: href and ("/display/" in href or "/pages/" in href) and "#" not in href
@@ -103,18 +117,19 @@ class NASANTRSScraper(BaseMappedSubScraper, BaseScraper):
                     if "mat-button-disabled" in next_page_button.get_attribute("class"):
                         break
 
-                    # otherwise, click on it and wait until the page is loaded
+                    # otherwise, click on it, once the pause after the previous page is over, and wait until the next
+                    # page replaced the PDF links of the current one (up to 5 seconds)
+                    self._navigation_pacer.wait()
                     self._logger.info("Clicking on Next Page Button")
-                    self._driver.execute_script("arguments[0].click();", next_page_button)
-
-                    # Sleep for some time to avoid being blocked by the server on the next request
-                    self._driver.cdp.sleep(random.uniform(2, 5))
+                    next_page_button.click()
+                    self._evaluate(_NEXT_PAGE_LOADED_SCRIPT, await_promise=True)
 
                     self._driver.uc_gui_click_captcha()
                     self._wait_for_page_load()
                     self._handle_cookie()
 
                     scraper = self._get_parsed_page_source()
+                    self._navigation_pacer.done()
                 except:
                     break
 
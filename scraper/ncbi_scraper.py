@@ -24,7 +24,7 @@ class NCBIScraper(BasePaginationPublisherScraper):
 
     def _scrape_landing_page(self, landing_page_url: str, source_number: int) -> None:
         self._logger.info(f"Processing Landing Page {landing_page_url}")
-        self._scrape_url(landing_page_url)
+        self._open_url(landing_page_url)
 
     def _scrape_page(self, url: str) -> ResultSet | None:
         try:
@@ -1,13 +1,14 @@
-import os
+import re
 from typing import Type, List
-from urllib.parse import urlparse
 
-from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element, get_ancestor
+from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element
 from model.base_iterative_publisher_models import IterativePublisherScrapeIssueOutput
 from model.oxford_academic_models import OxfordAcademicConfig, OxfordAcademicJournal
 from model.sql_models import ScraperFailure
 from scraper.base_iterative_publisher_scraper import BaseIterativePublisherScraper
 
+_ISSUE_URL_RE = re.compile(r"/issue/([^/]+)/([^/]+)")
+
 
 class OxfordAcademicScraper(BaseIterativePublisherScraper):
     @property
@@ -17,10 +18,13 @@ class OxfordAcademicScraper(BaseIterativePublisherScraper):
     def journal_identifier(self, model: OxfordAcademicJournal) -> str:
         return model.code
 
+    def _get_issue_url(self, journal: OxfordAcademicJournal, volume_num: int, issue_num: int) -> str:
+        return f"{journal.url.rstrip('/')}/issue/{volume_num}/{issue_num}"
+
     def _scrape_issue(
         self, journal: OxfordAcademicJournal, volume_num: int, issue_num: int
     ) -> IterativePublisherScrapeIssueOutput | None:
-        issue_url = os.path.join(journal.url, "issue", str(volume_num), str(issue_num))
+        issue_url = self._get_issue_url(journal, volume_num, issue_num)
         self._logger.info(f"Processing Issue URL: {issue_url}")
         return self.__scrape_issue(issue_url)
 
@@ -34,31 +38,28 @@ class OxfordAcademicScraper(BaseIterativePublisherScraper):
         Returns:
             IterativePublisherScrapeIssueOutput | None: A list of PDF links found in the issue, or None is something went wrong
         """
-        parsed_url = urlparse(issue_url)
-
-        path = parsed_url.path.lstrip("/")
-        _, _, volume_num, issue_num = path.split("/")
+        volume_num, issue_num = match.groups() if (match := _ISSUE_URL_RE.search(issue_url)) else ("", "")
 
         try:
-            self._scrape_url(issue_url)
+            self._open_url(issue_url)
 
+            # a single query for the links of the open-access articles, instead of walking up from each icon
             try:
-                tags = self._driver.cdp.find_all("i.icon-availability_open", timeout=0.5)
+                a_tags = self._driver.cdp.find_all(
+                    "h5.customLink.item-title:has(i.icon-availability_open) a.at-articleLink", timeout=0.5
+                )
             except:
-                tags = []
+                a_tags = []
 
             # find all the URLs to the articles where I can grab the PDF links
             articles_links = [
                 get_scraped_url_by_web_element(a_tag, self._config_model.base_url)
-                for tag in tags
-                if (ancestor := get_ancestor(tag, "h5.customLink.item-title"))
-                   and (a_tag := ancestor.query_selector("a.at-articleLink"))
-                   and (href := a_tag.get_attribute("href"))
-                   and "/article/" in href
+                for a_tag in a_tags
+                if (href := a_tag.get_attribute("href")) and "/article/" in href
             ]
 
             pdf_links = [
-                pdf_link for pdf_link in map(lambda link: self._scrape_article(link), articles_links) if pdf_link
+                pdf_link for pdf_link in map(self._get_article_link, articles_links) if pdf_link
             ]
 
             self._logger.debug(f"PDF links found: {len(pdf_links)}")
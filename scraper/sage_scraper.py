@@ -4,6 +4,7 @@ from bs4 import Tag
 from helper.utils import get_scraped_url_by_bs_tag
 from model.base_pagination_publisher_models import BasePaginationPublisherConfig, BasePaginationPublisherScrapeOutput
 from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScraper
+from scraper.base_scraper import LINKS_ONLY
 
 
 class SageScraper(BasePaginationPublisherScraper):
@@ -32,7 +33,7 @@ class SageScraper(BasePaginationPublisherScraper):
 
     def _scrape_page(self, url: str) -> List[Tag] | None:
         try:
-            scraper = self._scrape_url(url)
+            scraper = self._scrape_url(url, parse_only=LINKS_ONLY)
 
             # Find all article links in the pagination URL, using the appropriate class or tag (if lambda returns True, it will be included in the list)
             articles_links = [
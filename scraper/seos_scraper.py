@@ -1,4 +1,4 @@
-import os
+from itertools import chain
 from typing import List, Type, Dict
 from bs4 import Tag
 
@@ -40,10 +40,8 @@ class SeosScraper(BaseScraper):
         scraper = self._scrape_url(link)
         html_tags = scraper.find_all("a", href=lambda href: href and folder in href)
 
-        if not (html_links := list(set([
-            get_scraped_url_by_bs_tag(tag, os.path.join(self._config_model.base_url, folder))
-            for tag in html_tags
-        ]))):
+        folder_url = f"{self._config_model.base_url.rstrip('/')}/{folder}"
+        if not (html_links := list(dict.fromkeys(get_scraped_url_by_bs_tag(tag, folder_url) for tag in html_tags))):
             self._save_failure(link)
 
         return html_links
@@ -62,21 +60,15 @@ class SeosScraper(BaseScraper):
 
         scraper = self._scrape_url(source.url)
 
-        html_tags = []
-        for i in range(source.chapter_start, source.chapters + 1):
-            try:
-                i_str = f"{i}" if i >= 10 else f"0{i}"  # Add leading zero if needed
-
-                html_tags.extend(
-                    scraper.find_all("a", href=lambda href: href and i_str in href and source.search in href)
-                )
-            except Exception as e:
-                self._logger.error(f"Failed to process Chapter {i}. Error: {e}")
-
-        if not (html_links := list(set([
-            get_scraped_url_by_bs_tag(tag, os.path.join(self._config_model.base_url, source.folder))
-            for tag in html_tags
-        ]))):
+        # build the chapter keys once (with leading zero if needed), then match all the chapters in a single pass
+        chapter_keys = tuple(f"{i:02d}" for i in range(source.chapter_start, source.chapters + 1))
+        search = source.search
+        html_tags = scraper.find_all(
+            "a", href=lambda href: href and search in href and any(key in href for key in chapter_keys)
+        )
+
+        folder_url = f"{self._config_model.base_url.rstrip('/')}/{source.folder}"
+        if not (html_links := list(dict.fromkeys(get_scraped_url_by_bs_tag(tag, folder_url) for tag in html_tags))):
             self._save_failure(source.url)
 
         self._logger.debug(f"HTML links found: {len(html_links)}")
@@ -93,5 +85,4 @@ class SeosScraper(BaseScraper):
             List[str]: A list of strings containing the HTML links
         """
 
-        links = [link for links in scrape_output.values() for link in links]
-        return list(set(links))
+        return list(dict.fromkeys(chain.from_iterable(scrape_output.values())))
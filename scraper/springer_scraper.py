@@ -1,7 +1,9 @@
+import re
 from typing import List, Dict, Type
 from bs4 import ResultSet, Tag
+import soupsieve
 
-from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element, get_ancestor
+from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element
 from model.base_mapped_models import BaseMappedUrlSource, BaseMappedPaginationConfig, BaseMappedUrlConfig
 from model.base_pagination_publisher_models import BasePaginationPublisherScrapeOutput
 from scraper.base_mapped_publisher_scraper import BaseMappedPublisherScraper
@@ -9,6 +11,10 @@ from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScr
 from scraper.base_scraper import BaseMappedSubScraper
 from scraper.base_url_publisher_scraper import BaseUrlPublisherScraper, SourceType
 
+_CONTENT_TYPE_PATH_RE = re.compile(r"/(?:article|chapter|book)/")
+_ARTICLE_LINK_SELECTOR = soupsieve.compile('a[href*="/article/"]')
+_PDF_LINK_SELECTOR = soupsieve.compile('a[href*="/pdf/"]')
+
 
 class SpringerScraper(BaseMappedPublisherScraper):
     @property
@@ -34,8 +40,8 @@ class SpringerUrlScraper(BaseUrlPublisherScraper, BaseMappedSubScraper):
             try:
                 scraper = self._scrape_url(f"{source.url}?filterOpenAccess=false&page={counter}")
 
-                # Find all PDF links using appropriate class or tag (if lambda returns True, it will be included in the list)
-                tags = scraper.find_all("a", href=lambda href: href and "/article/" in href)
+                # Find all the article links
+                tags = _ARTICLE_LINK_SELECTOR.select(scraper)
                 if len(tags) == 0:
                     break
 
@@ -60,14 +66,14 @@ class SpringerUrlScraper(BaseUrlPublisherScraper, BaseMappedSubScraper):
         self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
         return pdf_tag_list
 
-    def _scrape_issue_or_collection(self, source: BaseMappedUrlSource) -> ResultSet | None:
+    def _scrape_issue_or_collection(self, source: BaseMappedUrlSource) -> ResultSet | List[Tag] | None:
         self._logger.info(f"Processing Issue / Collection {source.url}")
 
         try:
             scraper = self._scrape_url(source.url)
 
-            # Find all PDF links using appropriate class or tag (if lambda returns True, it will be included in the list)
-            if not (pdf_tag_list := scraper.find_all("a", href=lambda href: href and "/pdf/" in href)):
+            # Find all PDF links
+            if not (pdf_tag_list := _PDF_LINK_SELECTOR.select(scraper)):
                 self._save_failure(source.url)
 
             self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
@@ -82,8 +88,8 @@ class SpringerUrlScraper(BaseUrlPublisherScraper, BaseMappedSubScraper):
         try:
             scraper = self._scrape_url(source.url)
 
-            # Find the PDF link using appropriate class or tag (if lambda returns True, it will be included in the list)
-            if not (tag := scraper.find("a", href=lambda href: href and "/pdf/" in href)):
+            # Find the PDF link
+            if not (tag := _PDF_LINK_SELECTOR.select_one(scraper)):
                 self._save_failure(source.url)
 
             return tag
@@ -120,30 +126,25 @@ class SpringerSearchEngineScraper(BasePaginationPublisherScraper, BaseMappedSubS
 
     def _scrape_page(self, url: str) -> List[Tag] | None:
         try:
-            self._scrape_url(url)
+            self._open_url(url)
 
+            # a single query for the links of the full-access cards, instead of walking up from each access icon
             try:
-                tags = self._driver.cdp.find_all("svg.app-entitlement__icon--full-access", timeout=0.5)
+                a_tags = self._driver.cdp.find_all(
+                    "div.app-card-open__main:has(svg.app-entitlement__icon--full-access) a.app-card-open__link",
+                    timeout=0.5,
+                )
             except:
-                tags = []
+                a_tags = []
 
-            articles_links = [
-                get_scraped_url_by_web_element(a_tag, self._config_model.base_url)
-                for tag in tags
-                if (ancestor := get_ancestor(tag, "div.app-card-open__main"))
-                   and (a_tag := ancestor.query_selector("a.app-card-open__link"))
-            ]
+            articles_links = [get_scraped_url_by_web_element(a_tag, self._config_model.base_url) for a_tag in a_tags]
 
             if not articles_links:
                 self.__consecutive_failures += 1
                 self._save_failure(url)
 
             pdf_tag_list = [
-                Tag(name="a", attrs={
-                    "href": link.replace("/article/", "/content/pdf/").replace(
-                        "/chapter/", "/content/pdf/"
-                    ).replace("/book/", "/content/pdf/")
-                })
+                Tag(name="a", attrs={"href": _CONTENT_TYPE_PATH_RE.sub("/content/pdf/", link)})
                 for link in articles_links
             ]
 
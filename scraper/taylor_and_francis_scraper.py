@@ -15,7 +15,7 @@ class TaylorAndFrancisScraper(BaseUrlPublisherScraper):
         self._logger.info(f"Processing Journal {source.url}")
 
         try:
-            self._scrape_url(source.url)
+            self._open_url(source.url)
 
             buttons = self._driver.cdp.find_elements("li.vol_li > button.volume_link", timeout=0.5)
 
@@ -27,7 +27,7 @@ class TaylorAndFrancisScraper(BaseUrlPublisherScraper):
                     get_scraped_url_by_bs_tag(x, self._config_model.base_url)
                     for x in self._get_parsed_page_source().find_all("a", href=True, class_="issue-link")
                 ])
-            issues_links = list(set(issues_links))
+            issues_links = list(dict.fromkeys(issues_links))
 
             # For each tag of issues previously collected, scrape the issue as a collection of articles
             pdf_tag_list = [
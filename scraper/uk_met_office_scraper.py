@@ -1,11 +1,11 @@
-import random
 from typing import List, Type
 from bs4 import ResultSet, Tag
-from selenium.common import TimeoutException
 
 from model.base_url_publisher_models import BaseUrlPublisherSource, BaseUrlPublisherConfig
 from scraper.base_url_publisher_scraper import BaseUrlPublisherScraper
 
+_PDF_LINK_SELECTOR = "a.card-link-value[href]"
+
 
 class UKMetOfficeScraper(BaseUrlPublisherScraper):
     @property
@@ -16,10 +16,12 @@ class UKMetOfficeScraper(BaseUrlPublisherScraper):
         pass
 
     def _scrape_issue_or_collection(self, source: BaseUrlPublisherSource) -> List[Tag] | None:
+        from selenium.common import TimeoutException
+
         self._logger.info(f"Processing Issue / Collection {source.url}")
 
         try:
-            self._scrape_url(source.url)
+            self._open_url(source.url)
 
             pdf_tag_list = []
 
@@ -28,16 +30,17 @@ class UKMetOfficeScraper(BaseUrlPublisherScraper):
             page_buttons = {page_button.text: page_button for page_button in page_buttons if page_button.text.isdigit()}
 
             for page_button in page_buttons.values():
-                self._driver.execute_script("arguments[0].click();", page_button)
+                self._navigation_pacer.wait()
+                page_button.click()
                 try:
                     self._driver.cdp.assert_element_not_visible("#loading-overflow", timeout=10)
                 except TimeoutException:
                     pass
 
-                scraper = self._get_parsed_page_source()
-                pdf_tag_list.extend(scraper.find_all("a", href=True, class_="card-link-value"))
-
-                self._driver.cdp.sleep(random.uniform(2, 5))
+                pdf_tag_list.extend(
+                    Tag(name="a", attrs={"href": href}) for href in self._extract_attrs(_PDF_LINK_SELECTOR, "href")
+                )
+                self._navigation_pacer.done()
 
             self._logger.debug(f"PDF links found: {len(pdf_tag_list)}")
 
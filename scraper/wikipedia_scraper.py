@@ -17,7 +17,7 @@ class WikipediaScraper(BaseUrlPublisherScraper):
         self._logger.info(f"Processing Issue / Collection {source.url}")
 
         try:
-            self._scrape_url(source.url)
+            self._open_url(source.url)
 
             html_tag_list = self._driver.cdp.find_elements("div.mw-category-generated a", timeout=0.5)
 
@@ -1,7 +1,7 @@
 from typing import Type, List
 from bs4 import ResultSet, Tag
 
-from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element, get_ancestor
+from helper.utils import get_scraped_url_by_bs_tag, get_scraped_url_by_web_element
 from model.base_pagination_publisher_models import BasePaginationPublisherScrapeOutput
 from model.wiley_models import WileyConfig
 from scraper.base_pagination_publisher_scraper import BasePaginationPublisherScraper
@@ -31,20 +31,20 @@ class WileyScraper(BasePaginationPublisherScraper):
 
     def _scrape_page(self, url: str) -> List[Tag] | None:
         try:
-            self._scrape_url(url)
+            self._open_url(url)
 
+            # a single query for the titles of the open-access items, instead of walking up from each lock icon
             try:
-                tags = self._driver.cdp.find_all("i.icon-icon-lock_open", timeout=0.5)
+                a_tags = self._driver.cdp.find_all(
+                    "div.item__body:has(i.icon-icon-lock_open) a.publication_title.visitable", timeout=0.5
+                )
             except:
-                tags = []
+                a_tags = []
 
             if not (articles_links := [
                 get_scraped_url_by_web_element(a_tag, self.__source.base_url).replace("/doi/", "/doi/pdfdirect/")
-                for tag in tags
-                if (ancestor := get_ancestor(tag, "div.item__body"))
-                   and (a_tag := ancestor.query_selector("a.publication_title.visitable"))
-                   and (href := a_tag.get_attribute("href"))
-                   and "/doi/" in href
+                for a_tag in a_tags
+                if (href := a_tag.get_attribute("href")) and "/doi/" in href
             ]):
                 self._save_failure(url)
 
@@ -1,5 +1,4 @@
 from typing import Any, Type, List, Dict
-from seleniumbase import SB
 
 from helper.utils import get_sb_configuration
 from model.base_mapped_models import BaseMappedSourceConfig
@@ -14,13 +13,23 @@ class ScrapeAdapter:
         self.__scraper_type = scraper
         self.__logging_scraper = logging_scraper
         self.__config_model = config_model
+        self.__scraper: BaseScraper | None = None
 
-    def scrape(self) -> Any:
+    @property
+    def requires_browser(self) -> bool:
+        return self.__scraper_type is not None
+
+    def scrape(self, driver: Any | None = None) -> Any:
         if self.__scraper_type is None:
             return self.__config_model.urls
 
-        scraper = self.__scraper_type()
-        scraper.set_config_model(self.__config_model).set_logging_db_scraper(self.__logging_scraper)
+        scraper = self.__get_scraper()
+
+        # a browser already running is reused, otherwise one is started for this source only
+        if driver is not None:
+            return scraper.set_driver(driver).scrape()
+
+        from seleniumbase import SB
 
         with SB(**get_sb_configuration()) as driver:
             driver.activate_cdp_mode()
@@ -33,30 +42,29 @@ class ScrapeAdapter:
         if self.__scraper_type is None:
             return [failure.source]
 
-        scraper = self.__scraper_type()
-        scraper.set_config_model(self.__config_model).set_logging_db_scraper(self.__logging_scraper)
-        return scraper.scrape_failure(failure)
+        return self.__get_scraper().scrape_failure(failure)
 
     def post_process(self, scrape_output: Any) -> Any:
         if self.__scraper_type is None:
             return scrape_output
 
-        scraper = self.__scraper_type()
-        scraper.set_config_model(self.__config_model).set_logging_db_scraper(self.__logging_scraper)
-        return scraper.post_process(scrape_output)
+        return self.__get_scraper().post_process(scrape_output)
 
     def upload_to_s3(
         self, scrape_output: List[str] | Dict[str, List[str]], bucket_key: str, files_by_request: bool
     ) -> bool:
-        from scraper.direct_links_scraper import DirectLinksScraper
         if self.__config_model.bucket_key is None:
             self.__config_model.bucket_key = bucket_key
         if self.__config_model.files_by_request is None:
             self.__config_model.files_by_request = files_by_request
 
-        if self.__scraper_type is not None:
-            scraper = self.__scraper_type()
-        else:
-            scraper = DirectLinksScraper()
-        scraper.set_config_model(self.__config_model).set_logging_db_scraper(self.__logging_scraper)
-        return scraper.upload_to_s3(scrape_output)
+        return self.__get_scraper().upload_to_s3(scrape_output)
+
+    def __get_scraper(self) -> BaseScraper:
+        # the scraper is created once and reused by all the phases, so that its clients and repositories are set up once
+        from scraper.direct_links_scraper import DirectLinksScraper
+
+        if self.__scraper is None:
+            self.__scraper = (self.__scraper_type or DirectLinksScraper)()
+            self.__scraper.set_config_model(self.__config_model).set_logging_db_scraper(self.__logging_scraper)
+        return self.__scraper
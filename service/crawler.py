@@ -1,13 +1,55 @@
 import os
+import threading
 from uuid import uuid4
-from typing import Any
+from typing import Any, Dict, Type
 from urllib.parse import urlparse
 import scrapy
 from urllib.parse import urljoin
+from scrapy.crawler import Crawler, CrawlerRunner
 from scrapy.http import Response
+from scrapy.utils.log import configure_logging
 
 from helper.utils import get_user_agent
 
+_runner: CrawlerRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def crawl(spider_type: Type[scrapy.Spider], settings: Dict[str, Any] | None = None, **kwargs: Any):
+    """
+    Run a spider and wait for the crawl to end. The crawls share the Twisted reactor of the process, which is started
+    in a background thread on first use and is never stopped, since it cannot be restarted: hence, subsequent crawls
+    skip the reactor startup, and can be run even after the first crawl ended.
+
+    Args:
+        spider_type (Type[scrapy.Spider]): The spider to run.
+        settings (Dict[str, Any] | None): The settings of the crawl, overridden by the custom settings of the spider.
+        **kwargs (Any): The arguments of the spider.
+    """
+    global _runner
+
+    from twisted.internet import reactor
+
+    with _runner_lock:
+        if _runner is None:
+            configure_logging()
+            _runner = CrawlerRunner()
+            threading.Thread(target=reactor.run, kwargs={"installSignalHandlers": False}, daemon=True).start()
+
+    done = threading.Event()
+    failures = []
+
+    def start_crawl():
+        deferred = _runner.crawl(Crawler(spider_type, settings), **kwargs)
+        deferred.addErrback(failures.append)
+        deferred.addBoth(lambda _: done.set())
+
+    reactor.callFromThread(start_crawl)
+    done.wait()
+
+    if failures:
+        failures[0].raiseException()
+
 
 class CustomUserAgentMiddleware:
     """
@@ -22,8 +64,17 @@ class EveSpider(scrapy.Spider):
     custom_settings = {
         "DOWNLOAD_DELAY": 1.0,
         "ROBOTSTXT_OBEY": True,
-        "CONCURRENT_REQUESTS": 8,
-        "CONCURRENT_REQUESTS_PER_DOMAIN": 4,
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 8,
+        # adapt the delay to the latency of each domain, never going below DOWNLOAD_DELAY
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_START_DELAY": 1.0,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 4.0,
+        "RETRY_ENABLED": True,
+        # keep the fetched pages on disk, so that a crawl run again does not fetch them twice; they expire after a day,
+        # as the pages cached by the scrapers, so that the later crawls find the new files
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_EXPIRATION_SECS": 24 * 3600,
         "DOWNLOADER_MIDDLEWARES": {
             "service.crawler.CustomUserAgentMiddleware": 400,
             "scrapy.downloadermiddlewares.cookies.CookiesMiddleware": 700,
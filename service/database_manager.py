@@ -314,6 +314,31 @@ class DatabaseManager:
 
         return self.execute_with_retry(operation)
 
+    def get_distinct_values(
+        self, table_name: str, column_name: str, conditions: Dict[str, Any] | None = None
+    ) -> List[Any]:
+        """
+        Retrieve the distinct values of a column, without loading the other columns of the records
+
+        Args:
+            table_name: Name of the table
+            column_name: Name of the column
+            conditions: Dictionary with the search criteria of the records, if any
+
+        Returns:
+            List of the distinct values of the column
+        """
+        def operation():
+            with self.session_scope() as session:
+                table = self.get_table(table_name)
+                query = session.query(getattr(table.c, column_name))
+                if conditions:
+                    query = query.filter(*[getattr(table.c, k) == v for k, v in conditions.items()])
+                result = query.distinct().all()
+                return [row[0] for row in result]
+
+        return self.execute_with_retry(operation)
+
     def search_records(
         self,
         table_name: str,
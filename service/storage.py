@@ -1,6 +1,9 @@
+import io
 import os
 from typing import Final
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
 from helper.logger import setup_logger
 from helper.singleton import singleton
@@ -15,9 +18,22 @@ class S3Storage:
             region_name=os.getenv("AWS_REGION"),
             endpoint_url=os.getenv("AWS_URL"),
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_KEY")
+            aws_secret_access_key=os.getenv("AWS_SECRET_KEY"),
+            # the throttled requests are retried with a client-side rate adapting to the server, and the pool is large
+            # enough for the concurrent uploads, each of them sending its parts concurrently; the pooled connections are
+            # kept alive with TCP keep-alive probes, so that those idle between the uploads are not dropped and set up
+            # again
+            config=Config(
+                retries={"mode": "adaptive", "max_attempts": 5}, max_pool_connections=64, tcp_keepalive=True
+            ),
         )
         self.bucket_name: Final[str] = os.getenv("AWS_BUCKET_NAME")
+        self.transfer_config: Final[TransferConfig] = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        )
         self.logger: Final = setup_logger(__name__)
 
         self.create_bucket_if_not_existing()
@@ -50,8 +66,16 @@ class S3Storage:
     def upload_content(self, resource: UploadedResource) -> bool:
         self.logger.info(f"Uploading Source: {resource.source} to {resource.bucket_key}")
         try:
-            # Upload to S3
-            self.client.put_object(Bucket=self.bucket_name, Key=resource.bucket_key, Body=resource.content)
+            # Upload to S3: the content of a local file is streamed in chunks (multipart, if large enough), instead of
+            # being loaded into memory, while a content already in memory is sent in concurrent parts, if large enough
+            if resource.content_path:
+                self.client.upload_file(
+                    resource.content_path, self.bucket_name, resource.bucket_key, Config=self.transfer_config
+                )
+            else:
+                self.client.upload_fileobj(
+                    io.BytesIO(resource.content), self.bucket_name, resource.bucket_key, Config=self.transfer_config
+                )
             self.logger.info(f"Successfully uploaded to S3: {resource.bucket_key}")
 
             return True